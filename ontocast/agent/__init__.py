@@ -14,7 +14,7 @@ from .criticise_facts import criticise_facts
 from .criticise_ontology import criticise_ontology
 from .render_facts import render_facts_fresh
 from .render_ontology import render_ontology_fresh
-from .select_ontology import select_ontology
+from .select_ontology import select_ontology, select_ontology_batch
 from .sublimate_ontology import sublimate_ontology
 
 __all__ = [
@@ -25,6 +25,7 @@ __all__ = [
     "criticise_facts",
     "criticise_ontology",
     "select_ontology",
+    "select_ontology_batch",
     "serialize",
     "sublimate_ontology",
     "render_ontology_fresh",
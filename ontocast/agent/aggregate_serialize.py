@@ -26,9 +26,8 @@ def aggregate(state: AgentState, tools: ToolBox) -> AgentState:
     Returns:
         Updated agent state with aggregated facts
     """
-    for c in state.chunks_processed:
-        c.sanitize()
-
+    # Namespace sanitation of the chunk graphs is done by the aggregator
+    # in the same pass that collects namespaces
     state.aggregated_facts = tools.aggregator.aggregate_graphs(
         chunks=state.chunks_processed, doc_namespace=state.doc_namespace
     )
@@ -48,6 +47,9 @@ def aggregate(state: AgentState, tools: ToolBox) -> AgentState:
             f"Added provenance: {state.doc_namespace} dcterms:source {state.source_url}"
         )
 
+    # Compact standard vocabularies in the serialized output
+    state.aggregated_facts.bind_common_prefixes()
+
     return state
 
 
@@ -36,14 +36,16 @@ def chunk_text(state: AgentState, tools: ToolBox) -> AgentState:
         if state.max_chunks is not None:
             chunks_txt = chunks_txt[: state.max_chunks]
 
-        for chunk_txt in chunks_txt:
-            state.chunks.append(
+        state.chunks.extend(
+            [
                 Chunk(
                     text=chunk_txt,
                     hid=render_text_hash(chunk_txt),
                     doc_iri=state.doc_iri,
                 )
-            )
+                for chunk_txt in chunks_txt
+            ]
+        )
 
         logger.info(f"Created {len(state.chunks)} chunks for processing")
         state.status = Status.SUCCESS
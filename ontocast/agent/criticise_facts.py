@@ -28,6 +28,23 @@ from ontocast.toolbox import ToolBox
 
 logger = logging.getLogger(__name__)
 
+# Prompt template and parser are static; build them and render the format
+# instructions once at import
+CRITIQUE_PROMPT = PromptTemplate(
+    template=template_prompt,
+    input_variables=[
+        "preamble",
+        "evaluation_instruction",
+        "user_instruction",
+        "ontology_chapter",
+        "facts_chapter",
+        "text_chapter",
+        "format_instructions",
+    ],
+)
+CRITIQUE_PARSER = PydanticOutputParser(pydantic_object=FactsCritiqueReport)
+CRITIQUE_FORMAT_INSTRUCTIONS = CRITIQUE_PARSER.get_format_instructions()
+
 
 async def criticise_facts(state: AgentState, tools: ToolBox) -> AgentState:
     """Enhanced criticize facts with SPARQL operations.
@@ -52,9 +69,8 @@ async def criticise_facts(state: AgentState, tools: ToolBox) -> AgentState:
     )
 
     llm_tool = await tools.get_llm_tool(state.budget_tracker)
-    parser = PydanticOutputParser(pydantic_object=FactsCritiqueReport)
 
-    ontology_ttl = state.current_ontology.graph.serialize(format="turtle")
+    ontology_ttl = state.current_ontology.graph.to_turtle()
 
     ontology_chapter = ontology_template.format(
         ontology_ttl=ontology_ttl,
@@ -74,19 +90,6 @@ async def criticise_facts(state: AgentState, tools: ToolBox) -> AgentState:
         else ""
     )
 
-    prompt = PromptTemplate(
-        template=template_prompt,
-        input_variables=[
-            "preamble",
-            "evaluation_instruction",
-            "user_instruction",
-            "ontology_chapter",
-            "facts_chapter",
-            "text_chapter",
-            "format_instructions",
-        ],
-    )
-
     prompt_data = {
         "preamble": preamble,
         "evaluation_instruction": evaluation_instruction,
@@ -94,14 +97,14 @@ async def criticise_facts(state: AgentState, tools: ToolBox) -> AgentState:
         "ontology_chapter": ontology_chapter,
         "facts_chapter": facts_chapter,
         "text_chapter": text_chapter,
-        "format_instructions": parser.get_format_instructions(),
+        "format_instructions": CRITIQUE_FORMAT_INSTRUCTIONS,
     }
 
     try:
         critique: FactsCritiqueReport = await call_llm_with_retry(
             llm_tool=llm_tool,
-            prompt=prompt,
-            parser=parser,
+            prompt=CRITIQUE_PROMPT,
+            parser=CRITIQUE_PARSER,
             prompt_kwargs=prompt_data,
         )
         logger.debug(
@@ -24,6 +24,23 @@ from ontocast.toolbox import ToolBox
 
 logger = logging.getLogger(__name__)
 
+# Prompt template and parser are static; build them and render the format
+# instructions once at import
+CRITIQUE_PROMPT = PromptTemplate(
+    template=template_prompt,
+    input_variables=[
+        "preamble",
+        "facts_instruction",
+        "ontology_instruction",
+        "user_instruction",
+        "text_chapter",
+        "improvement_instruction",
+        "format_instructions",
+    ],
+)
+CRITIQUE_PARSER = PydanticOutputParser(pydantic_object=OntologyCritiqueReport)
+CRITIQUE_FORMAT_INSTRUCTIONS = CRITIQUE_PARSER.get_format_instructions()
+
 
 async def criticise_ontology(state: AgentState, tools: ToolBox) -> AgentState:
     """Enhanced ontology criticism with SPARQL operations.
@@ -53,10 +70,9 @@ async def criticise_ontology(state: AgentState, tools: ToolBox) -> AgentState:
             f"Null ontology cannot be criticised: {state.current_ontology.iri} is not a valid ontology"
         )
 
-    parser = PydanticOutputParser(pydantic_object=OntologyCritiqueReport)
     llm_tool: LLMTool = await tools.get_llm_tool(state.budget_tracker)
 
-    ontology_ttl = state.current_ontology.graph.serialize(format="turtle")
+    ontology_ttl = state.current_ontology.graph.to_turtle()
 
     ontology_chapter = ontology_template.format(
         ontology_ttl=ontology_ttl,
@@ -66,24 +82,11 @@ async def criticise_ontology(state: AgentState, tools: ToolBox) -> AgentState:
 
     user_instruction = state.ontology_user_instruction
 
-    prompt = PromptTemplate(
-        template=template_prompt,
-        input_variables=[
-            "preamble",
-            "facts_instruction",
-            "ontology_instruction",
-            "user_instruction",
-            "text_chapter",
-            "improvement_instruction",
-            "format_instructions",
-        ],
-    )
-
     try:
         critique: OntologyCritiqueReport = await call_llm_with_retry(
             llm_tool=llm_tool,
-            prompt=prompt,
-            parser=parser,
+            prompt=CRITIQUE_PROMPT,
+            parser=CRITIQUE_PARSER,
             prompt_kwargs={
                 "preamble": system_preamble,
                 "intro_instruction": intro_instruction,
@@ -91,7 +94,7 @@ async def criticise_ontology(state: AgentState, tools: ToolBox) -> AgentState:
                 "text_chapter": text_chapter,
                 "user_instruction": user_instruction,
                 "ontology_chapter": ontology_chapter,
-                "format_instructions": parser.get_format_instructions(),
+                "format_instructions": CRITIQUE_FORMAT_INSTRUCTIONS,
             },
         )
         logger.info(
@@ -33,6 +33,27 @@ from ontocast.toolbox import ToolBox
 
 logger = logging.getLogger(__name__)
 
+# Common prompt template used by both rendering functions, parsed once at import
+FACTS_PROMPT = PromptTemplate(
+    template=template_prompt,
+    input_variables=[
+        "preamble",
+        "facts_instruction",
+        "user_instruction",
+        "ontology_chapter",
+        "text_chapter",
+        "improvement_instruction",
+        "output_instruction",
+        "format_instructions",
+    ],
+)
+
+# Format instructions are deterministic per schema; render them once
+FRESH_PARSER = PydanticOutputParser(pydantic_object=SemanticTriplesFactsReport)
+FRESH_FORMAT_INSTRUCTIONS = FRESH_PARSER.get_format_instructions()
+UPDATE_PARSER = PydanticOutputParser(pydantic_object=GraphUpdate)
+UPDATE_FORMAT_INSTRUCTIONS = UPDATE_PARSER.get_format_instructions()
+
 
 async def render_facts(state: AgentState, tools: ToolBox) -> AgentState:
     """Structured hybrid facts renderer with Turtle/SPARQL decision logic.
@@ -71,7 +92,7 @@ def _prepare_prompt_data(state: AgentState) -> dict[str, str]:
         Dictionary containing formatted prompt components
     """
     ontology_chapter = ontology_template.format(
-        ontology_ttl=state.current_ontology.graph.serialize(format="turtle")
+        ontology_ttl=state.current_ontology.graph.to_turtle()
     )
 
     facts_instruction_str = facts_instruction_template.format(
@@ -99,27 +120,6 @@ def _prepare_prompt_data(state: AgentState) -> dict[str, str]:
     }
 
 
-def _create_prompt_template() -> PromptTemplate:
-    """Create the common prompt template used by both rendering functions.
-
-    Returns:
-        Configured PromptTemplate instance
-    """
-    return PromptTemplate(
-        template=template_prompt,
-        input_variables=[
-            "preamble",
-            "facts_instruction",
-            "user_instruction",
-            "ontology_chapter",
-            "text_chapter",
-            "improvement_instruction",
-            "output_instruction",
-            "format_instructions",
-        ],
-    )
-
-
 def _handle_rendering_error(
     state: AgentState, error: Exception, stage: FailureStage
 ) -> AgentState:
@@ -150,7 +150,6 @@ async def render_facts_fresh(state: AgentState, tools: ToolBox) -> AgentState:
     """
     logger.info("Rendering fresh facts")
     llm_tool = tools.llm
-    parser = PydanticOutputParser(pydantic_object=SemanticTriplesFactsReport)
 
     prompt_data = _prepare_prompt_data(state)
     prompt_data_fresh = {
@@ -160,15 +159,15 @@ async def render_facts_fresh(state: AgentState, tools: ToolBox) -> AgentState:
     }
     prompt_data.update(prompt_data_fresh)
 
-    prompt = _create_prompt_template()
+    prompt = FACTS_PROMPT
 
     try:
         proj = await call_llm_with_retry(
             llm_tool=llm_tool,
             prompt=prompt,
-            parser=parser,
+            parser=FRESH_PARSER,
             prompt_kwargs={
-                "format_instructions": parser.get_format_instructions(),
+                "format_instructions": FRESH_FORMAT_INSTRUCTIONS,
                 **prompt_data,
             },
         )
@@ -199,7 +198,6 @@ async def render_facts_update(state: AgentState, tools: ToolBox) -> AgentState:
     """
     logger.info("Rendering updates for facts")
     llm_tool = tools.llm
-    parser = PydanticOutputParser(pydantic_object=GraphUpdate)
 
     prompt_data = _prepare_prompt_data(state)
     prompt_data_update = {
@@ -213,15 +211,15 @@ async def render_facts_update(state: AgentState, tools: ToolBox) -> AgentState:
         ),
     }
     prompt_data.update(prompt_data_update)
-    prompt = _create_prompt_template()
+    prompt = FACTS_PROMPT
 
     try:
         graph_update = await call_llm_with_retry(
             llm_tool=llm_tool,
             prompt=prompt,
-            parser=parser,
+            parser=UPDATE_PARSER,
             prompt_kwargs={
-                "format_instructions": parser.get_format_instructions(),
+                "format_instructions": UPDATE_FORMAT_INSTRUCTIONS,
                 **prompt_data,
             },
         )
@@ -36,6 +36,29 @@ from ontocast.toolbox import ToolBox
 
 logger = logging.getLogger(__name__)
 
+# Common prompt template used by both rendering functions, parsed once at import
+ONTOLOGY_PROMPT = PromptTemplate(
+    template=template_prompt,
+    input_variables=[
+        "preamble",
+        "intro_instruction",
+        "ontology_instruction",
+        "output_instruction",
+        "user_instruction",
+        "improvement_instruction",
+        "ontology_ttl",
+        "text",
+        "format_instructions",
+    ],
+)
+
+# Format instructions are deterministic per schema; render them once so the
+# static prompt prefix stays byte-identical across calls
+FRESH_PARSER = PydanticOutputParser(pydantic_object=Ontology)
+FRESH_FORMAT_INSTRUCTIONS = FRESH_PARSER.get_format_instructions()
+UPDATE_PARSER = PydanticOutputParser(pydantic_object=GraphUpdate)
+UPDATE_FORMAT_INSTRUCTIONS = UPDATE_PARSER.get_format_instructions()
+
 
 async def render_ontology(state: AgentState, tools: ToolBox) -> AgentState:
     """Structured hybrid ontology renderer with Turtle/SPARQL decision logic.
@@ -78,7 +101,7 @@ async def render_ontology_fresh(state: AgentState, tools: ToolBox) -> AgentState
         AgentState: Updated state with rendered triples.
     """
 
-    parser = PydanticOutputParser(pydantic_object=Ontology)
+    parser = FRESH_PARSER
     logger.info("Rendering fresh ontology")
     intro_instruction = intro_instruction_fresh.format(
         current_domain=state.current_domain
@@ -92,20 +115,7 @@ async def render_ontology_fresh(state: AgentState, tools: ToolBox) -> AgentState
 
     text_chapter = text_template.format(text=state.current_chunk.text)
 
-    prompt = PromptTemplate(
-        template=template_prompt,
-        input_variables=[
-            "preamble",
-            "intro_instruction",
-            "ontology_instruction",
-            "output_instruction",
-            "user_instruction",
-            "improvement_instruction",
-            "ontology_ttl",
-            "text",
-            "format_instructions",
-        ],
-    )
+    prompt = ONTOLOGY_PROMPT
 
     try:
         llm_tool = await tools.get_llm_tool(state.budget_tracker)
@@ -122,7 +132,7 @@ async def render_ontology_fresh(state: AgentState, tools: ToolBox) -> AgentState
                 "user_instruction": state.ontology_user_instruction,
                 "improvement_instruction": improvement_instruction_str,
                 "text": text_chapter,
-                "format_instructions": parser.get_format_instructions(),
+                "format_instructions": FRESH_FORMAT_INSTRUCTIONS,
             },
         )
         state.current_ontology.graph.sanitize_prefixes_namespaces()
@@ -161,14 +171,14 @@ async def render_ontology_update(state: AgentState, tools: ToolBox) -> AgentStat
         AgentState: Updated state with rendered triples.
     """
 
-    parser = PydanticOutputParser(pydantic_object=GraphUpdate)
+    parser = UPDATE_PARSER
     ontology_iri = state.current_ontology.iri
     ontology_desc = state.current_ontology.describe()
     intro_instruction = intro_instruction_update.format(
         ontology_iri=ontology_iri, ontology_desc=ontology_desc
     )
     ontology_chapter = ontology_template.format(
-        ontology_ttl=state.current_ontology.graph.serialize(format="turtle")
+        ontology_ttl=state.current_ontology.graph.to_turtle()
     )
     output_instruction = output_instruction_sparql
     improvement_instruction_str = render_suggestions_prompt(
@@ -182,20 +192,7 @@ async def render_ontology_update(state: AgentState, tools: ToolBox) -> AgentStat
     )
     text_chapter = text_template.format(text=state.current_chunk.text)
 
-    prompt = PromptTemplate(
-        template=template_prompt,
-        input_variables=[
-            "preamble",
-            "intro_instruction",
-            "ontology_instruction",
-            "output_instruction",
-            "user_instruction",
-            "improvement_instruction",
-            "ontology_ttl",
-            "text",
-            "format_instructions",
-        ],
-    )
+    prompt = ONTOLOGY_PROMPT
 
     try:
         llm_tool = await tools.get_llm_tool(state.budget_tracker)
@@ -212,7 +209,7 @@ async def render_ontology_update(state: AgentState, tools: ToolBox) -> AgentStat
                 "ontology_ttl": ontology_chapter,
                 "user_instruction": state.ontology_user_instruction,
                 "text": text_chapter,
-                "format_instructions": parser.get_format_instructions(),
+                "format_instructions": UPDATE_FORMAT_INSTRUCTIONS,
             },
         )
         state.ontology_updates.append(graph_update)
@@ -5,12 +5,15 @@ the content of text chunks, ensuring that the chosen ontology best matches the
 domain and requirements of the text.
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 
 from langchain.output_parsers import PydanticOutputParser
 from langchain.prompts import PromptTemplate
 
 from ontocast.agent.common import call_llm_with_retry
+from ontocast.onto.chunk import EXCERPT_LENGTH
 from ontocast.onto.model import create_ontology_selector_report_model
 from ontocast.onto.null import NULL_ONTOLOGY
 from ontocast.onto.state import AgentState
@@ -20,6 +23,51 @@ from ontocast.toolbox import ToolBox
 
 logger = logging.getLogger(__name__)
 
+# Parsed once at import; the template itself does not depend on the call
+SELECTION_PROMPT = PromptTemplate(
+    template=template_prompt,
+    input_variables=[
+        "excerpt",
+        "ontologies_list",
+        "num_ontologies",
+        "format_instructions",
+    ],
+)
+
+
+@lru_cache(maxsize=64)
+def _get_selector_parser(num_ontologies: int) -> tuple[PydanticOutputParser, str]:
+    """Get the selector report parser and its format instructions.
+
+    Building the dynamic report model and dumping its JSON schema into format
+    instructions is repeated work for a given number of ontologies, so the
+    result is cached.
+
+    Args:
+        num_ontologies: The number of ontologies in the selection list.
+
+    Returns:
+        tuple[PydanticOutputParser, str]: The parser and its format instructions.
+    """
+    model = create_ontology_selector_report_model(num_ontologies)
+    parser = PydanticOutputParser(pydantic_object=model)
+    return parser, parser.get_format_instructions()
+
+
+def _normalize_excerpt(excerpt: str) -> str:
+    """Normalize an excerpt for selection caching.
+
+    Collapses whitespace and lowercases the text so that excerpts differing only
+    in formatting share a cache entry.
+
+    Args:
+        excerpt: The document excerpt.
+
+    Returns:
+        str: The normalized excerpt.
+    """
+    return " ".join(excerpt.split()).lower()
+
 
 def _create_document_excerpt(state: AgentState, max_length: int = 3000) -> str:
     """Create a representative excerpt from the document for ontology selection.
@@ -53,13 +101,17 @@ def _create_document_excerpt(state: AgentState, max_length: int = 3000) -> str:
 
         for idx in indices_to_sample:
             if idx < num_chunks and total_length < max_length:
-                chunk_text = state.chunks[idx].text
+                chunk = state.chunks[idx]
+                chunk_text = chunk.text
                 # Take a portion of this chunk
                 remaining = max_length - total_length
                 sample_length = min(chunk_length, remaining, len(chunk_text))
 
                 if sample_length > 0:
-                    if sample_length < len(chunk_text):
+                    if sample_length == min(EXCERPT_LENGTH, len(chunk_text)):
+                        # Default sample size: reuse the chunk's memoized excerpt
+                        excerpt_parts.append(chunk.excerpt)
+                    elif sample_length < len(chunk_text):
                         excerpt_parts.append(chunk_text[:sample_length] + " ...")
                     else:
                         excerpt_parts.append(chunk_text)
@@ -102,8 +154,9 @@ async def select_ontology(state: AgentState, tools: ToolBox) -> AgentState:
     # Skip if ontology already selected (for subsequent chunks in the loop)
     if not state.current_ontology.is_null():
         logger.debug(
-            f"Ontology already selected: {state.current_ontology.ontology_id}, "
-            "skipping selection to maintain one ontology per document"
+            "Ontology already selected: %s, "
+            "skipping selection to maintain one ontology per document",
+            state.current_ontology.ontology_id,
         )
         return state
 
@@ -116,67 +169,65 @@ async def select_ontology(state: AgentState, tools: ToolBox) -> AgentState:
         ontologies = om_tool.ontologies
         num_ontologies = len(ontologies)
 
-        # Create numbered list of ontologies
-        ontologies_list_lines = []
-        for i, ontology in enumerate(ontologies, start=1):
-            ontologies_list_lines.append(f"{i}. {ontology.describe()}")
-        ontologies_list_lines.append(
-            f"{len(ontologies) + 1}. None of the ontologies matches the text"
-        )
-        ontologies_list = "\n\n".join(ontologies_list_lines)
+        # Numbered list of ontologies (rendered once, cached by the manager)
+        ontologies_list = om_tool.ontologies_list_rendered
 
         logger.info(f"Presenting {num_ontologies} ontologies for selection")
 
         # Create a better document excerpt using multiple chunks
         excerpt = _create_document_excerpt(state, max_length=3000)
 
-        # Create dynamic model with correct constraint
-        ontology_selector_report_model = create_ontology_selector_report_model(
-            num_ontologies
-        )
-        parser = PydanticOutputParser(pydantic_object=ontology_selector_report_model)
-
-        prompt = PromptTemplate(
-            template=template_prompt,
-            input_variables=[
-                "excerpt",
-                "ontologies_list",
-                "num_ontologies",
-                "format_instructions",
-            ],
+        # Reuse earlier selections for (near-)identical excerpts
+        selection_config = {
+            "provider": llm_tool.config.provider,
+            "model_name": llm_tool.config.model_name,
+            "ontologies": "|".join(str(o.hash) for o in ontologies),
+        }
+        normalized_excerpt = _normalize_excerpt(excerpt)
+        cached_selection = tools.selection_cache.get(
+            normalized_excerpt, config=selection_config
         )
 
-        selector = await call_llm_with_retry(
-            llm_tool=llm_tool,
-            prompt=prompt,
-            parser=parser,
-            prompt_kwargs={
-                "excerpt": excerpt,
-                "ontologies_list": ontologies_list,
-                "num_ontologies": num_ontologies,
-                "format_instructions": parser.get_format_instructions(),
-            },
-        )
+        if isinstance(cached_selection, dict) and "answer_index" in cached_selection:
+            answer_index = int(cached_selection["answer_index"])
+            logger.debug(f"Selection cache hit: answer_index {answer_index}")
+        else:
+            # Dynamic model with correct constraint (cached per num_ontologies)
+            parser, format_instructions = _get_selector_parser(num_ontologies)
+
+            selector = await call_llm_with_retry(
+                llm_tool=llm_tool,
+                prompt=SELECTION_PROMPT,
+                parser=parser,
+                prompt_kwargs={
+                    "excerpt": excerpt,
+                    "ontologies_list": ontologies_list,
+                    "num_ontologies": num_ontologies,
+                    "format_instructions": format_instructions,
+                },
+            )
+            answer_index = selector.answer_index
+            tools.selection_cache.set(
+                normalized_excerpt,
+                {"answer_index": answer_index},
+                config=selection_config,
+            )
 
-        # Map answer_index to ontology
-        # answer_index: 1 to num_ontologies -> select ontology at (answer_index - 1)
-        # answer_index: num_ontologies + 1 -> select None
-        if selector.answer_index == num_ontologies + 1:
-            # None selected
-            logger.debug("LLM selected: None (no suitable ontology)")
-            state.current_ontology = NULL_ONTOLOGY
-        elif 1 <= selector.answer_index <= num_ontologies:
-            # Select ontology at index (answer_index - 1) since list is 0-based
-            selected_ontology = ontologies[selector.answer_index - 1]
+        # Map answer_index to ontology by table lookup:
+        # answer_index: 1 to num_ontologies -> ontology at (answer_index - 1)
+        # answer_index: num_ontologies + 1 -> None
+        choices = [*ontologies, NULL_ONTOLOGY]
+        idx = answer_index - 1
+        if 0 <= idx < len(choices):
+            state.current_ontology = choices[idx]
             logger.debug(
-                f"LLM selected ontology at index {selector.answer_index}: "
-                f"{selected_ontology.ontology_id} ({selected_ontology.iri})"
+                f"LLM selected option {answer_index}: "
+                f"{state.current_ontology.ontology_id} ({state.current_ontology.iri})"
             )
-            state.current_ontology = selected_ontology
         else:
             # This should not happen due to Pydantic validation, but handle gracefully
             logger.warning(
-                f"Invalid answer_index {selector.answer_index} "
+                f"Invalid answer_index {answer_index} "
                 f"(expected 1-{num_ontologies + 1}), defaulting to NULL_ONTOLOGY"
             )
             state.current_ontology = NULL_ONTOLOGY
@@ -190,5 +241,32 @@ async def select_ontology(state: AgentState, tools: ToolBox) -> AgentState:
             f"Set initial version for ontology {state.current_ontology.ontology_id}: {state.current_ontology.initial_version}"
         )
 
-    logger.debug(f"Current ontology set to: {state.current_ontology.ontology_id}")
+    logger.debug("Current ontology set to: %s", state.current_ontology.ontology_id)
     return state
+
+
+async def select_ontology_batch(
+    states: list[AgentState], tools: ToolBox, max_concurrency: int = 4
+) -> list[AgentState]:
+    """Select ontologies for several documents concurrently.
+
+    Each state is processed by `select_ontology`, so the same prompt and parser
+    machinery is used. The LLM calls are launched together and bounded by a
+    semaphore to respect provider rate limits. Results are returned in the same
+    order as the input states.
+
+    Args:
+        states: The agent states, one per document.
+        tools: The toolbox instance providing utility functions.
+        max_concurrency: Maximum number of concurrent selection calls.
+
+    Returns:
+        list[AgentState]: Updated states, in input order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _select(state: AgentState) -> AgentState:
+        async with semaphore:
+            return await select_ontology(state, tools)
+
+    return list(await asyncio.gather(*(_select(state) for state in states)))
@@ -14,7 +14,7 @@ from pathlib import Path
 import click
 from dotenv import load_dotenv
 
-from ontocast.config import Config
+from ontocast.config import get_config
 from ontocast.onto.ontology_operations import (
     merge_terminal_ontologies,
     plot_ontology_graph,
@@ -49,7 +49,7 @@ def main(env_file: Path, iri: str, output: Path):
     """Merge terminal ontologies from Fuseki and plot the result."""
     # Load configuration
     load_dotenv(dotenv_path=env_file.expanduser())
-    config = Config()
+    config = get_config()
 
     # Validate configuration
     config.validate_llm_config()
@@ -29,23 +29,31 @@ Example:
 """
 
 import asyncio
+import codecs
 import logging
 import logging.config
 import pathlib
+import tempfile
+import uuid
+from collections.abc import Iterable, Iterator
 
 import click
+import orjson
 from dotenv import load_dotenv
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph.state import CompiledStateGraph
+from rdflib import Graph
 
 from ontocast.cli.util import crawl_directories
-from ontocast.config import Config, ServerConfig
+from ontocast.config import ServerConfig, get_config
 from ontocast.onto.state import AgentState
-from ontocast.stategraph import create_agent_graph
 from ontocast.toolbox import ToolBox
 
 logger = logging.getLogger(__name__)
 
+# Size of the body pieces yielded by streamed /process responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 def calculate_recursion_limit(
     head_chunks: int | None,
@@ -73,15 +81,80 @@ def calculate_recursion_limit(
         )
 
 
+def json_body(obj: dict) -> bytes:
+    """Serialize a response payload to JSON bytes.
+
+    Robyn's ``jsonify`` also uses orjson but decodes the result to ``str``;
+    returning the bytes avoids that copy for large Turtle payloads.
+
+    Args:
+        obj: JSON-serializable payload.
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    return orjson.dumps(obj)
+
+
+def iter_turtle(graph: Graph, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """Serialize a graph to Turtle and yield it piece by piece.
+
+    The graph is serialized into a spooled temporary file (spilling to disk
+    for large graphs), so the whole Turtle document is never held as one string.
+
+    Args:
+        graph: Graph to serialize.
+        chunk_size: Number of bytes read per yielded piece.
+
+    Yields:
+        str: Consecutive pieces of the Turtle document.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=16 * chunk_size) as buf:
+        graph.serialize(destination=buf, format="turtle")
+        buf.seek(0)
+        # Incremental decoding keeps multi-byte characters split across reads intact
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        while block := buf.read(chunk_size):
+            yield decoder.decode(block)
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+def iter_multipart(
+    parts: list[tuple[str, str, Iterable[str]]], boundary: str
+) -> Iterator[str]:
+    """Frame body parts as a multipart/mixed stream.
+
+    Args:
+        parts: Tuples of (part name, content type, body pieces).
+        boundary: Multipart boundary string.
+
+    Yields:
+        str: Pieces of the multipart body.
+    """
+    for name, content_type, body in parts:
+        yield (
+            f"--{boundary}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f'Content-Disposition: inline; name="{name}"\r\n\r\n'
+        )
+        yield from body
+        yield "\r\n"
+    yield f"--{boundary}--\r\n"
+
+
 def create_app(
     tools: ToolBox,
     server_config: ServerConfig,
     head_chunks: int | None = None,
 ):
-    from robyn import Headers, Request, Response, Robyn, jsonify
+    from robyn import Headers, Request, Response, Robyn, StreamingResponse
 
     app = Robyn(__file__)
-    workflow: CompiledStateGraph = create_agent_graph(tools)
+    # Shared by all JSON responses; Robyn copies headers out without mutating them
+    json_headers = Headers({"Content-Type": "application/json"})
+    workflow: CompiledStateGraph = tools.agent_graph
     recursion_limit = calculate_recursion_limit(
         head_chunks,
         server_config,
@@ -95,16 +168,16 @@ def create_app(
             if tools.llm is None:
                 return Response(
                     status_code=503,
-                    headers=Headers({"Content-Type": "application/json"}),
-                    description=jsonify(
+                    headers=json_headers,
+                    description=json_body(
                         {"status": "unhealthy", "error": "LLM not initialized"}
                     ),
                 )
 
             return Response(
                 status_code=200,
-                headers=Headers({"Content-Type": "application/json"}),
-                description=jsonify(
+                headers=json_headers,
+                description=json_body(
                     {
                         "status": "healthy",
                         "version": "0.1.1",
@@ -116,8 +189,8 @@ def create_app(
             logger.error(f"Health check failed: {str(e)}")
             return Response(
                 status_code=503,
-                headers=Headers({"Content-Type": "application/json"}),
-                description=jsonify({"status": "unhealthy", "error": str(e)}),
+                headers=json_headers,
+                description=json_body({"status": "unhealthy", "error": str(e)}),
             )
 
     @app.get("/info")
@@ -125,8 +198,8 @@ def create_app(
         """MCP info endpoint."""
         return Response(
             status_code=200,
-            headers=Headers({"Content-Type": "application/json"}),
-            description=jsonify(
+            headers=json_headers,
+            description=json_body(
                 {
                     "name": "ontocast",
                     "version": "0.1.1",
@@ -167,8 +240,8 @@ def create_app(
             if tools.triple_store_manager is None:
                 return Response(
                     status_code=400,
-                    headers=Headers({"Content-Type": "application/json"}),
-                    description=jsonify(
+                    headers=json_headers,
+                    description=json_body(
                         {
                             "status": "error",
                             "error": "No triple store manager configured",
@@ -196,8 +269,8 @@ def create_app(
 
             return Response(
                 status_code=200,
-                headers=Headers({"Content-Type": "application/json"}),
-                description=jsonify(
+                headers=json_headers,
+                description=json_body(
                     {
                         "status": "success",
                         "message": message,
@@ -208,8 +281,8 @@ def create_app(
             logger.error(f"Error flushing triple store: {str(e)}")
             return Response(
                 status_code=500,
-                headers=Headers({"Content-Type": "application/json"}),
-                description=jsonify(
+                headers=json_headers,
+                description=json_body(
                     {
                         "status": "error",
                         "error": str(e),
@@ -220,13 +293,19 @@ def create_app(
 
     @app.post("/process")
     async def process(request: Request):
-        """MCP process endpoint."""
+        """MCP process endpoint.
+
+        With ``stream=true`` the result is returned as a streamed
+        ``multipart/mixed`` body with ``metadata`` (JSON), ``facts`` and
+        ``ontology`` (Turtle) parts instead of a single JSON document.
+        """
         workflow_state: dict | None = None
         try:
             content_type = request.headers.get("content-type")
             logger.debug(f"Content-Type: {content_type}")
-            logger.debug(f"Request headers: {request.headers}")
-            logger.debug(f"Request body: {request.body}")
+            # Lazy arguments: headers and body are only formatted at DEBUG level
+            logger.debug("Request headers: %s", request.headers)
+            logger.debug("Request body: %s", request.body)
 
             # Extract parameters from query parameters
             dataset = request.query_params.get("dataset", None)
@@ -249,6 +328,11 @@ def create_app(
                     f"Using skip_ontology_development: {skip_ontology_development}"
                 )
 
+            # Extract stream from query parameters
+            stream = request.query_params.get("stream", None)
+            if stream:
+                logger.debug(f"Using stream: {stream}")
+
             # Extract user instructions from query parameters (available for both JSON and multipart)
             ontology_user_instruction = request.query_params.get(
                 "ontology_user_instruction", ""
@@ -267,21 +351,24 @@ def create_app(
 
             if content_type and content_type.startswith("application/json"):
                 data = request.body
-                # Convert string to bytes if needed
-                if isinstance(data, str):
-                    bytes_data = data.encode("utf-8")
-                else:
-                    bytes_data = data
-                logger.debug(
-                    f"Parsed JSON data: {data}, bytes length: {len(bytes_data)}"
+                # Robyn usually hands over bytes; only encode str bodies
+                bytes_data = (
+                    data if isinstance(data, (bytes, bytearray)) else data.encode()
                 )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Parsed JSON data: {data}, bytes length: {len(bytes_data)}"
+                    )
                 files = {"input.json": bytes_data}
                 # User instructions already extracted from query params above
                 # They can also be overridden by convert_document.py for JSON files
             elif content_type and content_type.startswith("multipart/form-data"):
                 files = request.files
-                logger.debug(f"Files: {files.keys()}")
-                logger.debug(f"Files-types: {[(k, type(v)) for k, v in files.items()]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Files: {files.keys()}")
+                    logger.debug(
+                        f"Files-types: {[(k, type(v)) for k, v in files.items()]}"
+                    )
 
                 # Check if form data contains user instructions (overrides query params)
                 if hasattr(request, "form_data") and request.form_data:
@@ -305,8 +392,8 @@ def create_app(
                 if not files:
                     return Response(
                         status_code=400,
-                        headers=Headers({"Content-Type": "application/json"}),
-                        description=jsonify(
+                        headers=json_headers,
+                        description=json_body(
                             {
                                 "status": "error",
                                 "error": "No file provided",
@@ -318,8 +405,8 @@ def create_app(
                 logger.debug(f"Unsupported content type: {content_type}")
                 return Response(
                     status_code=400,
-                    headers=Headers({"Content-Type": "application/json"}),
-                    description=jsonify(
+                    headers=json_headers,
+                    description=json_body(
                         {
                             "status": "error",
                             "error": f"Unsupported content type: {content_type}",
@@ -363,6 +450,7 @@ def create_app(
             skip_ontology_development_value: bool = parse_bool_param(
                 skip_ontology_development, server_config.skip_ontology_development
             )
+            stream_value: bool = parse_bool_param(stream, False)
 
             initial_state = AgentState(
                 files=files,
@@ -393,6 +481,44 @@ def create_app(
                 # Convert Pydantic model to dict using model_dump()
                 budget_tracker_data = budget_tracker.model_dump()
 
+            metadata = {
+                "status": workflow_state["status"],
+                "chunks_processed": len(workflow_state.get("chunks_processed", [])),
+                "chunks_remaining": len(workflow_state.get("chunks", [])),
+                "budget": budget_tracker_data,
+            }
+
+            if stream_value:
+                # Graphs go out as separate Turtle parts, serialized lazily
+                # while the body is sent, instead of as strings inside JSON
+                facts = workflow_state.get("aggregated_facts")
+                ontology = workflow_state.get("current_ontology")
+                boundary = uuid.uuid4().hex
+                parts = [
+                    (
+                        "metadata",
+                        "application/json",
+                        [
+                            json_body(
+                                {"status": "success", "metadata": metadata}
+                            ).decode()
+                        ],
+                    ),
+                    ("facts", "text/turtle", iter_turtle(facts) if facts else []),
+                    (
+                        "ontology",
+                        "text/turtle",
+                        iter_turtle(ontology.graph) if ontology else [],
+                    ),
+                ]
+                content_type = f"multipart/mixed; boundary={boundary}"
+                return StreamingResponse(
+                    content=iter_multipart(parts, boundary),
+                    status_code=200,
+                    headers=Headers({"Content-Type": content_type}),
+                    media_type=content_type,
+                )
+
             result = {
                 "status": "success",
                 "data": {
@@ -407,18 +533,13 @@ def create_app(
                     if workflow_state.get("current_ontology")
                     else "",
                 },
-                "metadata": {
-                    "status": workflow_state["status"],
-                    "chunks_processed": len(workflow_state.get("chunks_processed", [])),
-                    "chunks_remaining": len(workflow_state.get("chunks", [])),
-                    "budget": budget_tracker_data,
-                },
+                "metadata": metadata,
             }
 
             return Response(
                 status_code=200,
-                headers=Headers({"Content-Type": "application/json"}),
-                description=jsonify(result),
+                headers=json_headers,
+                description=json_body(result),
             )
 
         except Exception as e:
@@ -436,8 +557,8 @@ def create_app(
 
             return Response(
                 status_code=500,
-                headers=Headers({"Content-Type": "application/json"}),
-                description=jsonify(
+                headers=json_headers,
+                description=json_body(
                     {
                         "status": "error",
                         "error": str(e),
@@ -480,7 +601,7 @@ def run(
 
     _ = load_dotenv(dotenv_path=env_file.expanduser())
     # Global configuration instance
-    config = Config()
+    config = get_config()
 
     # Validate LLM configuration
     config.validate_llm_config()
@@ -493,10 +614,8 @@ def run(
         except Exception as e:
             logger.error(f"could set logging level correctly {e}")
 
+    # Paths are already expanded by PathConfig validation
     if config.tool_config.path_config.working_directory is not None:
-        config.tool_config.path_config.working_directory = pathlib.Path(
-            config.tool_config.path_config.working_directory
-        ).expanduser()
         config.tool_config.path_config.working_directory.mkdir(
             parents=True, exist_ok=True
         )
@@ -505,19 +624,12 @@ def run(
             "Working directory must be provided via CLI argument or WORKING_DIRECTORY config"
         )
 
-    if config.tool_config.path_config.ontology_directory is not None:
-        config.tool_config.path_config.ontology_directory = pathlib.Path(
-            config.tool_config.path_config.ontology_directory
-        ).expanduser()
-
-    # Create ToolBox with config
-    tools: ToolBox = ToolBox(config)
-    asyncio.run(tools.initialize())
-
-    workflow: CompiledStateGraph = create_agent_graph(tools)
+    # Create and initialize ToolBox with config on a single event loop
+    tools: ToolBox = asyncio.run(ToolBox.abuild(config))
 
     if input_path:
         input_path = input_path.expanduser()
+        workflow: CompiledStateGraph = tools.agent_graph
 
         files = sorted(
             crawl_directories(
@@ -531,11 +643,13 @@ def run(
             config.server,
         )
 
-        async def process_files():
-            for file_path in files:
+        async def process_file(file_path: pathlib.Path, semaphore: asyncio.Semaphore):
+            async with semaphore:
                 try:
+                    # Read off the event loop so disk I/O overlaps other documents
+                    content = await asyncio.to_thread(file_path.read_bytes)
                     state = AgentState(
-                        files={file_path.as_posix(): file_path.read_bytes()},
+                        files={file_path.as_posix(): content},
                         max_visits=config.server.max_visits,
                         max_chunks=head_chunks,
                         skip_ontology_development=config.server.skip_ontology_development,
@@ -552,6 +666,13 @@ def run(
                 except Exception as e:
                     logger.error(f"Error processing {file_path}: {str(e)}")
 
+        async def process_files():
+            # Documents are independent, so overlap their LLM and store I/O
+            semaphore = asyncio.Semaphore(config.server.max_concurrent_docs)
+            await asyncio.gather(
+                *(process_file(file_path, semaphore) for file_path in files)
+            )
+
         asyncio.run(process_files())
     else:
         app = create_app(
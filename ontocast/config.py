@@ -5,6 +5,7 @@ environment variables and usage patterns in the OntoCast system.
 """
 
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -65,6 +66,18 @@ class LLMConfig(BaseSettings):
         default=None, description="LLM base URL (for ollama, etc.)"
     )
     api_key: str | None = Field(default=None, description="API key for LLM provider")
+    max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of concurrent LLM requests for independent "
+        "calls, e.g. ontology summaries at startup",
+    )
+    min_triples_for_summary: int = Field(
+        default=1,
+        ge=0,
+        description="Ontologies with fewer triples besides their header get "
+        "default properties instead of an LLM summary",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="LLM_",
@@ -131,6 +144,12 @@ class ServerConfig(BaseSettings):
     skip_facts_rendering: bool = Field(
         default=False, description="Skip facts rendering and go straight to aggregation"
     )
+    max_concurrent_docs: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of input files processed concurrently "
+        "in CLI (--input-path) mode",
+    )
     ontology_max_triples: int | None = Field(
         default=50000,
         description="Maximum number of triples allowed in ontology graph. "
@@ -205,6 +224,12 @@ class PathConfig(BaseSettings):
         case_sensitive=False,
     )
 
+    @field_validator("working_directory", "ontology_directory", "cache_dir")
+    @classmethod
+    def expand_user(cls, v: Path | None) -> Path | None:
+        """Expand ``~`` in configured paths once, at validation time."""
+        return v.expanduser() if v is not None else v
+
 
 class ToolConfig(BaseSettings):
     """Configuration for tools (LLM, triple stores, paths, chunking)."""
@@ -255,3 +280,16 @@ class Config(BaseSettings):
             raise ValueError(
                 "LLM_API_KEY environment variable is required for OpenAI provider"
             )
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the process-wide configuration.
+
+    The configuration is read from the environment on first call and reused
+    afterwards, so environment (e.g. ``.env``) must be loaded before.
+
+    Returns:
+        Config: Validated configuration.
+    """
+    return Config()
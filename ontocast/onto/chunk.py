@@ -1,8 +1,13 @@
+from functools import cached_property
+
 from pydantic import BaseModel, Field
 
 from ontocast.onto.rdfgraph import RDFGraph
 from ontocast.util import iri2namespace
 
+# Length of the per-chunk excerpt used for ontology selection
+EXCERPT_LENGTH = 1000
+
 
 class Chunk(BaseModel):
     """A chunk of text with associated metadata and RDF graph.
@@ -26,6 +31,19 @@ class Chunk(BaseModel):
 
     processed: bool = Field(default=False, description="Was the chunk processed?")
 
+    @cached_property
+    def excerpt(self) -> str:
+        """Get the leading excerpt of the chunk text.
+
+        Memoized, so workflow retries do not re-slice the text.
+
+        Returns:
+            str: At most EXCERPT_LENGTH characters, with " ..." if truncated.
+        """
+        if len(self.text) <= EXCERPT_LENGTH:
+            return self.text
+        return self.text[:EXCERPT_LENGTH] + " ..."
+
     @property
     def iri(self):
         """Get the IRI for this chunk.
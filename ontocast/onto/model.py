@@ -9,20 +9,32 @@ from ontocast.onto.rdfgraph import RDFGraph
 class BasePydanticModel(BaseModel):
     """Base class for Pydantic models with serialization capabilities."""
 
-    def __init__(self, **kwargs):
-        """Initialize the model with given keyword arguments."""
-        super().__init__(**kwargs)
-
-    def serialize(self, file_path: str | pathlib.Path) -> None:
+    def serialize(
+        self,
+        file_path: str | pathlib.Path,
+        exclude: set[str] | dict | None = None,
+        exclude_none: bool = False,
+        exclude_defaults: bool = False,
+    ) -> None:
         """Serialize the state to a JSON file.
 
         Args:
             file_path: Path to save the JSON file.
+            exclude: Fields to leave out of the dump.
+            exclude_none: Whether to skip fields that are None.
+            exclude_defaults: Whether to skip fields left at their default.
         """
-        state_json = self.model_dump_json(indent=4)
+        # pydantic-core returns UTF-8 bytes directly, skipping the str round-trip
+        state_json = self.__pydantic_serializer__.to_json(
+            self,
+            indent=4,
+            exclude=exclude,
+            exclude_none=exclude_none,
+            exclude_defaults=exclude_defaults,
+        )
         if isinstance(file_path, str):
             file_path = pathlib.Path(file_path)
-        file_path.write_text(state_json)
+        file_path.write_bytes(state_json)
 
     @classmethod
     def load(cls, file_path: str | pathlib.Path):
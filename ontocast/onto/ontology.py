@@ -1,7 +1,6 @@
 import logging
 import pathlib
 import re
-from collections import defaultdict
 from datetime import datetime
 from typing import Annotated, Union
 
@@ -16,6 +15,21 @@ from ontocast.util import iri2namespace
 
 logger = logging.getLogger(__name__)
 
+# Ontology-level predicates excluded from the content hash: hash identifier,
+# parent hash, created_at, version, title/label and description/comment
+_METADATA_PREDICATES = frozenset(
+    {
+        DCTERMS.identifier,
+        PROV.wasDerivedFrom,
+        DCTERMS.created,
+        OWL.versionInfo,
+        RDFS.label,
+        DCTERMS.title,
+        DCTERMS.description,
+        RDFS.comment,
+    }
+)
+
 # Semantic version pattern: MAJOR.MINOR.PATCH (e.g., 1.2.3)
 SemanticVersion = Annotated[
     str,
@@ -159,7 +173,14 @@ class Ontology(OntologyPropertiesWithLineage):
         default=DEFAULT_DOMAIN, description="Domain for ontology IRI construction."
     )
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Properties are reassigned throughout construction and sync: keep assignment
+    # unvalidated and never re-validate nested instances
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        validate_assignment=False,
+        revalidate_instances="never",
+        extra="ignore",
+    )
 
     def __init__(self, **kwargs):
         # Pop current_domain if provided, else use DEFAULT_DOMAIN
@@ -297,15 +318,8 @@ class Ontology(OntologyPropertiesWithLineage):
         Returns:
             str | None: The namespace prefix if found, None otherwise.
         """
-        prefixes = [
-            prefix
-            for prefix, iri in self.graph.namespaces()
-            if iri == URIRef(self.namespace)
-        ]
-        if len(prefixes) == 0:
-            return None
-        else:
-            return prefixes[0]
+        # The store keeps a namespace -> prefix index, no need to scan bindings
+        return self.graph.store.prefix(URIRef(self.namespace))
 
     def is_null(self) -> bool:
         """Check if this ontology is the null ontology.
@@ -364,10 +378,11 @@ class Ontology(OntologyPropertiesWithLineage):
         if self.is_null():
             return
 
+        # is_null() is False from here on, so it is not re-checked below
         if self.ontology_id is not None:
-            if not self.iri or self.is_null():
+            if not self.iri:
                 self.iri = f"{self.current_domain}/{self.ontology_id}"
-            elif self.iri:
+            else:
                 expected_iri = f"{self.current_domain}/{self.ontology_id}"
                 # Only fix IRI if it doesn't match expected pattern AND it's not from an external source
                 # Don't override IRIs that came from the graph or were explicitly provided
@@ -389,32 +404,29 @@ class Ontology(OntologyPropertiesWithLineage):
                             f"'{expected_iri}', fixing"
                         )
                         self.iri = expected_iri
-        elif self.iri and not self.is_null():
-            # Only derive ontology_id if this is not a null ontology
+        elif self.iri:
             self.ontology_id = derive_ontology_id(self.iri)
 
         onto_iri = URIRef(self.iri)
         g = self.graph
 
-        onto_triple = [
-            subj
-            for subj, _, o in g.triples((None, RDF.type, None))
-            if o == OWL.Ontology
-        ]
-        if not onto_triple:
+        # Indexed lookup of the owl:Ontology subject, stops at the first match
+        onto_iri_graph = next(g.subjects(RDF.type, OWL.Ontology), None)
+        if onto_iri_graph is None:
             if onto_iri is not None:
                 # iri set as a property, but not in ontology
                 g.add((onto_iri, RDF.type, OWL.Ontology))
         else:
-            onto_iri_graph = onto_triple[0]
             onto_iri = onto_iri_graph
 
         # Collect all predicates for this subject in one pass
-        existing_preds = set(p for _, p, _ in g.triples((onto_iri, None, None)))
+        existing_preds = set(g.predicates(onto_iri, None))
+        # New triples are gathered and added in one addN call at the end
+        new_triples = []
 
         def add_if_missing(p, v):
             if p not in existing_preds:
-                g.add((onto_iri, p, Literal(v)))
+                new_triples.append((onto_iri, p, Literal(v)))
 
         # Add label/title
         if self.title:
@@ -428,19 +440,15 @@ class Ontology(OntologyPropertiesWithLineage):
         # Add version (update if exists)
         if self.version:
             # Remove existing version triples to update them
-            for _, _, obj in g.triples((onto_iri, OWL.versionInfo, None)):
-                g.remove((onto_iri, OWL.versionInfo, obj))
+            g.remove((onto_iri, OWL.versionInfo, None))
             # Add new version
-            g.add((onto_iri, OWL.versionInfo, Literal(self.version)))
+            new_triples.append((onto_iri, OWL.versionInfo, Literal(self.version)))
         # Add created_at if set (only if not already present in graph)
         if self.created_at:
             # Check if created_at already exists in graph - don't overwrite if present
-            existing_created = [
-                str(obj) for _, _, obj in g.triples((onto_iri, DCTERMS.created, None))
-            ]
-            if not existing_created:
+            if DCTERMS.created not in existing_preds:
                 # Add new created_at with datetime type
-                g.add(
+                new_triples.append(
                     (
                         onto_iri,
                         DCTERMS.created,
@@ -451,28 +459,32 @@ class Ontology(OntologyPropertiesWithLineage):
         # Use dcterms:identifier for hash (with "hash:" prefix to distinguish from other identifiers)
         if self.hash:
             # Check if hash already exists in graph
-            existing_hash = [
-                str(obj)
-                for _, _, obj in g.triples((onto_iri, DCTERMS.identifier, None))
-                if str(obj).startswith("hash:")
-            ]
-            if not existing_hash:
-                g.add((onto_iri, DCTERMS.identifier, Literal(f"hash:{self.hash}")))
+            has_hash = any(
+                str(obj).startswith("hash:")
+                for obj in g.objects(onto_iri, DCTERMS.identifier)
+            )
+            if not has_hash:
+                new_triples.append(
+                    (onto_iri, DCTERMS.identifier, Literal(f"hash:{self.hash}"))
+                )
 
         # Add parent_hashes (multiple parents supported)
         # Use prov:wasDerivedFrom for each parent hash (standard PROV predicate)
         if self.parent_hashes:
             # Get existing parent hashes to avoid duplicates
             existing_parent_uris = {
-                str(obj)
-                for _, _, obj in g.triples((onto_iri, PROV.wasDerivedFrom, None))
+                str(obj) for obj in g.objects(onto_iri, PROV.wasDerivedFrom)
             }
 
             # Add each parent hash as a URIRef if not already present
             for parent_hash in self.parent_hashes:
                 parent_hash_uri = URIRef(f"urn:hash:{parent_hash}")
                 if str(parent_hash_uri) not in existing_parent_uris:
-                    g.add((onto_iri, PROV.wasDerivedFrom, parent_hash_uri))
+                    new_triples.append(
+                        (onto_iri, PROV.wasDerivedFrom, parent_hash_uri)
+                    )
+
+        g.addN((s, p, o, g) for s, p, o in new_triples)
 
     def _compute_and_set_hash(self) -> None:
         """Compute the hash of the ontology graph and set it.
@@ -485,48 +497,34 @@ class Ontology(OntologyPropertiesWithLineage):
         if self.graph and len(self.graph) > 0:
             try:
                 # Find the ontology IRI from the graph if not set
-                onto_iri = None
                 if self.iri and not self.is_null():
                     onto_iri = URIRef(self.iri)
                 else:
                     # Try to find ontology IRI from graph
-                    onto_triples = [
-                        subj
-                        for subj, _, o in self.graph.triples((None, RDF.type, None))
-                        if o == OWL.Ontology
-                    ]
-                    if onto_triples:
-                        onto_iri = onto_triples[0]
+                    onto_iri = next(self.graph.subjects(RDF.type, OWL.Ontology), None)
 
                 # Create a temporary graph without hash/parent_hash triples for hashing
                 temp_graph = RDFGraph()
 
-                # Copy all triples except metadata triples - these are metadata, not content
-                # Metadata to exclude: hash, parent_hash, created_at, version, title, description
-                for s, p, o in self.graph:
-                    # Skip metadata triples for the ontology IRI
-                    if onto_iri and s == onto_iri:
-                        if (
-                            p == DCTERMS.identifier
-                            and isinstance(o, Literal)
-                            and str(o).startswith("hash:")
-                        ):
-                            continue  # Skip hash identifier
-                        if p == PROV.wasDerivedFrom:
-                            continue  # Skip parent hash
-                        if p == DCTERMS.created:
-                            continue  # Skip created_at
-                        if p == OWL.versionInfo:
-                            continue  # Skip version
-                        if p == RDFS.label:
-                            continue  # Skip title/label
-                        if p == DCTERMS.title:
-                            continue  # Skip title
-                        if p == DCTERMS.description:
-                            continue  # Skip description
-                        if p == RDFS.comment:
-                            continue  # Skip description (comment)
-                    temp_graph.add((s, p, o))
+                def is_metadata(s, p, o) -> bool:
+                    return (
+                        onto_iri is not None
+                        and s == onto_iri
+                        and p in _METADATA_PREDICATES
+                        # only "hash:" identifiers are metadata
+                        and (
+                            p != DCTERMS.identifier
+                            or (isinstance(o, Literal) and str(o).startswith("hash:"))
+                        )
+                    )
+
+                # Copy all triples except metadata triples of the ontology IRI -
+                # these are metadata, not content - in a single addN pass
+                temp_graph.addN(
+                    (s, p, o, temp_graph)
+                    for s, p, o in self.graph
+                    if not is_metadata(s, p, o)
+                )
 
                 # Copy namespace bindings
                 for prefix, uri in self.graph.namespaces():
@@ -860,12 +858,8 @@ class Ontology(OntologyPropertiesWithLineage):
             return
 
         # Only proceed if this subject is explicitly typed as owl:Ontology
-        onto_triple = [
-            subj
-            for subj, _, o in g.triples((None, RDF.type, None))
-            if o == OWL.Ontology
-        ]
-        if not onto_triple:
+        onto_iri = next(g.subjects(RDF.type, OWL.Ontology), None)
+        if onto_iri is None:
             # No owl:Ontology found - try to extract IRI from prefixes as fallback
             if not self.iri or self.iri == ONTOLOGY_NULL_IRI:
                 # Look for prefixes that might indicate the ontology IRI
@@ -894,7 +888,6 @@ class Ontology(OntologyPropertiesWithLineage):
                         return
             return
 
-        onto_iri = onto_triple[0]
         iri_str = str(onto_iri)
 
         # Strip hash fragment from IRI to ensure simplified representation
@@ -942,40 +935,35 @@ class Ontology(OntologyPropertiesWithLineage):
                 # Fallback to prefix if IRI derivation fails
                 self.ontology_id = prefix_id
 
-        # Collect all predicates and objects for this subject in one pass
-        pred_map = defaultdict(list)
-        for _, p, o in g.triples((onto_iri, None, None)):
-            pred_map[p].append(o)
+        # Targeted index lookups for the few predicates read below
+        def first_value(*predicates):
+            for p in predicates:
+                obj = g.value(onto_iri, p)
+                if obj is not None:
+                    return obj
+            return None
 
         # Title: try rdfs:label, dcterms:title
         if self.title is None:
-            title = None
-            if RDFS.label in pred_map:
-                title = str(pred_map[RDFS.label][0])
-            elif DCTERMS.title in pred_map:
-                title = str(pred_map[DCTERMS.title][0])
-            if title:
-                self.title = title
+            title = first_value(RDFS.label, DCTERMS.title)
+            if title is not None and str(title):
+                self.title = str(title)
 
         # Description: try dcterms:description, rdfs:comment
         if self.description is None:
-            description = None
-            if DCTERMS.description in pred_map:
-                description = str(pred_map[DCTERMS.description][0])
-            elif RDFS.comment in pred_map:
-                description = str(pred_map[RDFS.comment][0])
-            if description:
-                self.description = description
+            description = first_value(DCTERMS.description, RDFS.comment)
+            if description is not None and str(description):
+                self.description = str(description)
         # Version
         if self.version is None:
-            if OWL.versionInfo in pred_map:
-                version_str = str(pred_map[OWL.versionInfo][0])
-                self.version = self._normalize_version(version_str)
+            version = g.value(onto_iri, OWL.versionInfo)
+            if version is not None:
+                self.version = self._normalize_version(str(version))
         # Created at - only read if not already set (preserve existing value)
         if not getattr(self, "created_at", None):
-            if DCTERMS.created in pred_map:
-                # Get the first created date
-                created_str = str(pred_map[DCTERMS.created][0])
+            created = g.value(onto_iri, DCTERMS.created)
+            if created is not None:
+                created_str = str(created)
                 # Try to parse as datetime
                 try:
                     self.created_at = datetime.fromisoformat(
@@ -986,26 +974,25 @@ class Ontology(OntologyPropertiesWithLineage):
                     pass
         # Short name: try dcterms:title if not already used for title
         if not getattr(self, "ontology_id", None):
-            if DCTERMS.title in pred_map:
-                self.ontology_id = str(pred_map[DCTERMS.title][0])
+            short_name = g.value(onto_iri, DCTERMS.title)
+            if short_name is not None:
+                self.ontology_id = str(short_name)
         # Hash: read from dcterms:identifier with "hash:" prefix if present
         if self.hash is None:
-            if DCTERMS.identifier in pred_map:
-                for obj in pred_map[DCTERMS.identifier]:
-                    obj_str = str(obj)
-                    if obj_str.startswith("hash:"):
-                        self.hash = obj_str[5:]  # Remove "hash:" prefix
-                        break
+            for obj in g.objects(onto_iri, DCTERMS.identifier):
+                obj_str = str(obj)
+                if obj_str.startswith("hash:"):
+                    self.hash = obj_str[5:]  # Remove "hash:" prefix
+                    break
 
         # Parent_hashes: read all from prov:wasDerivedFrom if present
         if len(self.parent_hashes) == 0:
-            if PROV.wasDerivedFrom in pred_map:
-                for parent_uri_obj in pred_map[PROV.wasDerivedFrom]:
-                    parent_uri = str(parent_uri_obj)
-                    # Extract hash from URN format: urn:hash:<hash>
-                    if parent_uri.startswith("urn:hash:"):
-                        parent_hash = parent_uri[9:]  # Remove "urn:hash:" prefix
-                        self.parent_hashes.append(parent_hash)
+            for parent_uri_obj in g.objects(onto_iri, PROV.wasDerivedFrom):
+                parent_uri = str(parent_uri_obj)
+                # Extract hash from URN format: urn:hash:<hash>
+                if parent_uri.startswith("urn:hash:"):
+                    parent_hash = parent_uri[9:]  # Remove "urn:hash:" prefix
+                    self.parent_hashes.append(parent_hash)
 
     def __iadd__(self, other: Union["Ontology", RDFGraph]) -> "Ontology":
         """In-place addition operator for Ontology instances.
@@ -1045,8 +1032,7 @@ class Ontology(OntologyPropertiesWithLineage):
         Returns:
             Ontology: A new Ontology instance.
         """
-        graph: RDFGraph = RDFGraph()
-        graph.parse(file_path, format=format)
+        graph: RDFGraph = RDFGraph().parse_file(file_path, format=format)
         return cls(graph=graph, **kwargs)
 
     def describe(self) -> str:
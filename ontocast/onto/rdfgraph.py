@@ -14,10 +14,27 @@ from rdflib.namespace import NamespaceManager
 
 from ontocast.onto.constants import COMMON_PREFIXES
 
+try:
+    import oxrdflib  # type: ignore # noqa: F401 (registers the ox-* parser plugins)
+
+    FAST_PARSER_AVAILABLE = True
+except ImportError:
+    FAST_PARSER_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 PREFIX_PATTERN = re.compile(r"@prefix\s+(\w+):\s+<[^>]+>\s+\.")
 
+# rdflib formats that oxrdflib parses natively (Rust streaming parsers)
+FAST_PARSER_FORMATS = {
+    "turtle": "ox-turtle",
+    "ttl": "ox-turtle",
+    "nt": "ox-ntriples",
+    "ntriples": "ox-ntriples",
+    "nquads": "ox-nquads",
+    "trig": "ox-trig",
+}
+
 
 class RDFGraph(Graph):
     """Subclass of rdflib.Graph with Pydantic schema support.
@@ -26,6 +43,43 @@ class RDFGraph(Graph):
     capabilities for Pydantic models, with special handling for Turtle format.
     """
 
+    # Bumped by every triple mutation made through this graph; together with
+    # the size and bindings it keys the cached Turtle text, see `to_turtle`
+    _generation = 0
+    _turtle_cache: tuple[tuple, str] | None = None
+
+    def add(self, triple):
+        self._generation += 1
+        return super().add(triple)
+
+    def addN(self, quads):
+        self._generation += 1
+        return super().addN(quads)
+
+    def remove(self, triple):
+        self._generation += 1
+        return super().remove(triple)
+
+    def to_turtle(self) -> str:
+        """Serialize the graph to Turtle, reusing the last result if unchanged.
+
+        Agents put the same ontology into several prompts per chunk, so the
+        serialization is only redone after the triples or bindings change.
+
+        Returns:
+            str: The Turtle representation of the graph.
+        """
+        key = self._turtle_cache_key()
+        if self._turtle_cache is not None and self._turtle_cache[0] == key:
+            return self._turtle_cache[1]
+        turtle = self.serialize(format="turtle")
+        # Serializing may bind generated prefixes, so key on the state after it
+        self._turtle_cache = (self._turtle_cache_key(), turtle)
+        return turtle
+
+    def _turtle_cache_key(self) -> tuple:
+        return (self._generation, len(self), tuple(self.namespaces()))
+
     @classmethod
     def __get_pydantic_core_schema__(cls, _source_type, handler: GetCoreSchemaHandler):
         """Get the Pydantic core schema for this class.
@@ -97,20 +151,66 @@ class RDFGraph(Graph):
         Returns:
             RDFGraph: self after modification.
         """
-        # Use __add__ to get the merged result with proper prefix binding
-        result = self.__add__(other)
+        if other is self:
+            return self
 
-        # Clear current graph and copy the result
-        self.remove((None, None, None))  # Remove all triples
+        # Stream triples straight into the store instead of building a merged
+        # copy and re-adding it
+        self.addN((s, p, o, self) for s, p, o in other)
 
-        # Copy all triples from result
-        for triple in result:
-            self.add(triple)
+        # Copy namespace bindings from other if it's a Graph
+        if isinstance(other, Graph):
+            for prefix, uri in other.namespaces():
+                self.bind(prefix, uri)
+
+        return self
+
+    def bind_common_prefixes(self) -> None:
+        """Bind COMMON_PREFIXES that are not already in use.
 
-        # Copy namespace bindings from result
-        for prefix, uri in result.namespaces():
-            self.bind(prefix, uri)
+        Prefixes or namespaces that already have a binding are left untouched,
+        so bindings coming from the data win.
+        """
+        bound = list(self.namespaces())
+        bound_prefixes = {prefix for prefix, _ in bound}
+        bound_uris = {str(uri) for _, uri in bound}
+        for prefix, namespace in COMMON_PREFIXES.items():
+            if prefix not in bound_prefixes and str(namespace) not in bound_uris:
+                self.bind(prefix, namespace)
+
+    def parse_file(self, source, format: str = "turtle") -> "RDFGraph":
+        """Parse a file into this graph, using a native parser when available.
+
+        If the optional ``oxrdflib`` package is installed, Turtle and
+        N-Triples family formats are parsed by its native streaming parsers
+        and only the resulting triples are added to the rdflib store;
+        otherwise (or if the native parser fails) rdflib's own parser is used.
+        The native parser fills a scratch graph that is merged only on success,
+        so a failure partway leaves no partial triples behind.
+        Install with: pip install ontocast[fast]
+
+        Args:
+            source: Path or file-like object to parse.
+            format: rdflib format name of the input.
 
+        Returns:
+            RDFGraph: self, for chaining.
+        """
+        fast_format = FAST_PARSER_FORMATS.get(format)
+        if FAST_PARSER_AVAILABLE and fast_format is not None:
+            start = source.tell() if hasattr(source, "seek") else None
+            try:
+                parsed = RDFGraph()
+                parsed.parse(source, format=fast_format)
+            except Exception as e:
+                logger.debug(f"Native parser failed for {source}, falling back: {e}")
+                if start is not None:
+                    # Rewind the partly consumed stream for rdflib's parser
+                    source.seek(start)
+            else:
+                self += parsed
+                return self
+        self.parse(source, format=format)
         return self
 
     def copy(self) -> "RDFGraph":
@@ -155,7 +255,7 @@ class RDFGraph(Graph):
             return turtle_str
 
         prefix_block = (
-            "\n".join(f"@prefix {prefix}: {uri} ." for prefix, uri in missing.items())
+            "\n".join(f"@prefix {prefix}: <{uri}> ." for prefix, uri in missing.items())
             + "\n\n"
         )
 
@@ -17,9 +17,8 @@ from ontocast.onto.rdfgraph import RDFGraph
 
 logger = logging.getLogger(__name__)
 
-# Convert COMMON_PREFIXES from Turtle format (with angle brackets) to SPARQL format (without)
-# Example: "<http://example.org/>" -> "http://example.org/"
-STANDARD_PREFIXES = {prefix: uri.strip("<>") for prefix, uri in COMMON_PREFIXES.items()}
+# COMMON_PREFIXES as plain namespace strings for SPARQL prefix blocks
+STANDARD_PREFIXES = {prefix: str(uri) for prefix, uri in COMMON_PREFIXES.items()}
 
 
 class SPARQLOperationModel(BaseModel):
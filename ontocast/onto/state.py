@@ -1,8 +1,11 @@
 import os
+import pathlib
+import zipfile
 from collections import defaultdict
-from typing import Any
+from typing import Any, ClassVar
 
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, TypeAdapter
+from pydantic_core import from_json, to_json
 
 from ontocast.onto.chunk import Chunk
 from ontocast.onto.constants import (
@@ -18,6 +21,15 @@ from ontocast.onto.rdfgraph import RDFGraph
 from ontocast.onto.sparql_models import GraphUpdate, TripleOp
 from ontocast.util import iri2namespace, render_text_hash
 
+# Built once and shared, so bulk chunk I/O skips per-model serializer dispatch
+_CHUNKS_ADAPTER = TypeAdapter(list[Chunk])
+
+# Ontology fields whose graphs live in the binary sidecar: (graph, namespaces)
+_SIDECAR_GRAPHS = {
+    "current_ontology": ("ontology.nt", "namespaces.json"),
+    "ontology_addendum": ("addendum.nt", "addendum_namespaces.json"),
+}
+
 
 class BudgetTracker(BasePydanticModel):
     """Lightweight tracker for LLM usage statistics and generated triples."""
@@ -110,9 +122,15 @@ class AgentState(BasePydanticModel):
         max_chunks: Maximum number of chunks to process.
     """
 
+    # Bulky inputs left out of lightweight checkpoints (see serialize_light)
+    HEAVY_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {"input_text", "files", "chunks", "chunks_processed"}
+    )
+
     input_text: str = Field(description="Input text", default="")
     current_domain: str = Field(
-        description="IRI used for forming document namespace", default=DEFAULT_DOMAIN
+        description="IRI used for forming document namespace",
+        default_factory=lambda: os.getenv("CURRENT_DOMAIN", DEFAULT_DOMAIN),
     )
     doc_hid: str = Field(
         description="An almost unique hash / id for the parent document of the chunk",
@@ -225,7 +243,14 @@ class AgentState(BasePydanticModel):
         default=3, description="Maximum number of visits allowed per node"
     )
     max_chunks: int | None = None
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # State is mutated field by field on every workflow step: keep assignment
+    # unvalidated and never re-validate instances handed back by nodes
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        validate_assignment=False,
+        revalidate_instances="never",
+        extra="ignore",
+    )
     skip_ontology_development: bool = Field(
         default=False, description="Skip ontology create/improve steps if True"
     )
@@ -254,14 +279,110 @@ class AgentState(BasePydanticModel):
         description="Budget statistics tracker (LLM usage and generated triples)",
     )
 
-    def model_post_init(self, __context):
-        """Post-initialization hook for the model."""
-        pass
+    def serialize_light(self, file_path: str | pathlib.Path) -> None:
+        """Serialize the state without its bulky inputs.
+
+        Skips HEAVY_FIELDS as well as unset and default-valued fields; the
+        result loads back with those fields at their defaults.
+
+        Args:
+            file_path: Path to save the JSON file.
+        """
+        self.serialize(
+            file_path,
+            exclude=set(self.HEAVY_FIELDS),
+            exclude_none=True,
+            exclude_defaults=True,
+        )
+
+    def dump_chunks_json(self) -> bytes:
+        """Serialize the processed chunks to JSON in a single adapter call.
+
+        Returns:
+            bytes: JSON array of the processed chunks.
+        """
+        return _CHUNKS_ADAPTER.dump_json(self.chunks_processed)
+
+    def load_chunks(self, data: str | bytes) -> None:
+        """Replace the processed chunks with those from `dump_chunks_json` output.
 
-    def __init__(self, **kwargs):
-        """Initialize the agent state with given keyword arguments."""
-        super().__init__(**kwargs)
-        self.current_domain = os.getenv("CURRENT_DOMAIN", DEFAULT_DOMAIN)
+        Args:
+            data: JSON array of chunks.
+        """
+        self.chunks_processed = _CHUNKS_ADAPTER.validate_json(data)
+
+    def serialize_binary(self, directory: str | pathlib.Path) -> None:
+        """Serialize the state as JSON plus a binary sidecar.
+
+        Raw ``files``, the graphs of the current ontology and the ontology
+        addendum (as N-Triples) and the processed chunks go into an
+        uncompressed zip sidecar instead of the JSON
+        document, so binary inputs such as PDFs are stored verbatim and large
+        graphs are not escaped into JSON strings. The JSON records the sidecar
+        name; see `load_binary`.
+
+        Args:
+            directory: Directory to write ``state.json`` and ``state.bin`` to.
+        """
+        directory = pathlib.Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        sidecar = "state.bin"
+
+        with zipfile.ZipFile(directory / sidecar, "w", zipfile.ZIP_STORED) as zf:
+            for name, content in self.files.items():
+                zf.writestr(f"files/{name}", content)
+            for field, (graph_name, ns_name) in _SIDECAR_GRAPHS.items():
+                graph = getattr(self, field).graph
+                zf.writestr(graph_name, graph.serialize(format="nt", encoding="utf-8"))
+                # N-Triples carries no prefixes, keep the bindings alongside
+                zf.writestr(
+                    ns_name,
+                    to_json({prefix: str(uri) for prefix, uri in graph.namespaces()}),
+                )
+            zf.writestr("chunks_processed.json", self.dump_chunks_json())
+
+        state = self.__pydantic_serializer__.to_python(
+            self,
+            mode="json",
+            exclude={
+                "files": True,
+                "chunks_processed": True,
+                **{field: {"graph"} for field in _SIDECAR_GRAPHS},
+            },
+        )
+        state["binary_sidecar"] = sidecar
+        (directory / "state.json").write_bytes(to_json(state, indent=4))
+
+    @classmethod
+    def load_binary(cls, directory: str | pathlib.Path) -> "AgentState":
+        """Load a state written by `serialize_binary`.
+
+        Args:
+            directory: Directory containing ``state.json`` and its sidecar.
+
+        Returns:
+            AgentState: The loaded state.
+        """
+        directory = pathlib.Path(directory)
+        data = from_json((directory / "state.json").read_bytes())
+        sidecar = data.pop("binary_sidecar")
+        state = cls.model_validate(data)
+
+        with zipfile.ZipFile(directory / sidecar) as zf:
+            for name in zf.namelist():
+                if name.startswith("files/"):
+                    state.files[name.removeprefix("files/")] = zf.read(name)
+            names = set(zf.namelist())
+            for field, (graph_name, ns_name) in _SIDECAR_GRAPHS.items():
+                # Older sidecars kept the addendum graph in state.json
+                if graph_name not in names:
+                    continue
+                graph = getattr(state, field).graph
+                graph.parse(data=zf.read(graph_name), format="nt")
+                for prefix, uri in from_json(zf.read(ns_name)).items():
+                    graph.bind(prefix, uri)
+            state.load_chunks(zf.read("chunks_processed.json"))
+        return state
 
     def get_node_status(self, node: WorkflowNode) -> Status:
         """Get the status of a workflow node, returning NOT_VISITED if not set."""
@@ -335,8 +456,7 @@ class AgentState(BasePydanticModel):
         # Create a copy of the input graph
         # Use RDFGraph's copy method to preserve type
         updated_graph = RDFGraph()
-        for triple in graph:
-            updated_graph.add(triple)
+        updated_graph.addN((s, p, o, updated_graph) for s, p, o in graph)
         # Copy namespace bindings
         for prefix, namespace in graph.namespaces():
             updated_graph.bind(prefix, namespace)
@@ -1,25 +1,41 @@
 import re
-from urllib.parse import urlparse
+from functools import lru_cache
 
 from ontocast.util import CONVENTIONAL_MAPPINGS
 
+_EXT_RE = re.compile(r"\.(owl|ttl|rdf|xml)$", re.IGNORECASE)
+_TLD_RE = re.compile(r"^(.*?)\.(org|com|net|io|edu|gov|int|mil)$", re.IGNORECASE)
+_CLEAN_RE = re.compile(r"[^a-zA-Z0-9_-]")
+
 
 def derive_ontology_id(iri: str) -> str | None:
     if not isinstance(iri, str) or not iri.strip():
         return None
 
-    normalized_iri = iri.strip().rstrip("/#")
+    # Spelling variants of one IRI (trailing "/" or "#") share a cache entry
+    return _derive_ontology_id(iri.strip().rstrip("/#"))
+
 
+@lru_cache(maxsize=1024)
+def _derive_ontology_id(normalized_iri: str) -> str | None:
     if normalized_iri in CONVENTIONAL_MAPPINGS:
         return CONVENTIONAL_MAPPINGS[normalized_iri]
 
-    parsed = urlparse(normalized_iri)
+    # Only the authority and path are needed, so split by hand instead of
+    # going through urlparse
+    head = normalized_iri.split("#", 1)[0].split("?", 1)[0]
+    _, sep, rest = head.partition("://")
+    if sep:
+        netloc, slash, path = rest.partition("/")
+        path = slash + path
+    else:
+        netloc, path = "", head
 
     candidate = (
-        parsed.path.rsplit("/", 1)[-1]
-        if parsed.path and "/" in parsed.path
-        else parsed.netloc.split(".")[0]
-        if parsed.netloc
+        path.rsplit("/", 1)[-1]
+        if path and "/" in path
+        else netloc.split(".")[0]
+        if netloc
         else normalized_iri
     )
 
@@ -27,9 +43,9 @@ def derive_ontology_id(iri: str) -> str | None:
 
 
 def _clean_derived_id(value: str) -> str | None:
-    value = re.sub(r"\.(owl|ttl|rdf|xml)$", "", value, flags=re.IGNORECASE)
-    match = re.match(r"^(.*?)\.(org|com|net|io|edu|gov|int|mil)$", value, re.IGNORECASE)
+    value = _EXT_RE.sub("", value)
+    match = _TLD_RE.match(value)
     if match:
         value = match.group(1)
-    result = re.sub(r"[^a-zA-Z0-9_-]", "", value).lower()
+    result = _CLEAN_RE.sub("", value).lower()
     return result if result else None
@@ -1,21 +1,24 @@
+# Sections that do not change between chunks come first, so consecutive
+# requests share a byte-identical prefix that providers can serve from their
+# prompt cache; per-chunk sections (ontology, suggestions, text) come last
 template_prompt = """
 {preamble}
 
-{intro_instruction}
-
 {ontology_instruction}
 
-{user_instruction}
+{output_instruction}
 
-{improvement_instruction}
+{format_instructions}
 
-{ontology_ttl}
+{intro_instruction}
 
-{text}
+{user_instruction}
 
-{output_instruction}
+{ontology_ttl}
 
-{format_instructions}
+{improvement_instruction}
+
+{text}
 """
 
 intro_instruction_fresh = """
@@ -1,4 +1,7 @@
-template_prompt = """
+# Static part of the prompt: identical for every document as long as the set of
+# ontologies does not change, so it is placed first to keep the prompt prefix
+# stable for provider-side prompt caching.
+static_prefix = """
 You are a helpful assistant that decides which ontology to use for a given document.
 You are given a numbered list of ontologies and a document excerpt.
 You need to select which ontology can be used for the document to create a semantic graph.
@@ -8,8 +11,13 @@ Select from the following options:
 
 {num_ontologies}. None - No suitable ontology available
 
+{format_instructions}
+"""
+
+# Per-document part of the prompt
+dynamic_suffix = """
 Here is an excerpt from the document:
 {excerpt}
-
-{format_instructions}
 """
+
+template_prompt = static_prefix + dynamic_suffix
@@ -28,7 +28,8 @@ def create_agent_graph(tools: ToolBox) -> CompiledStateGraph:
     This function constructs a directed graph representing the workflow of the
     ontology-based knowledge graph agent. The graph defines the sequence of
     operations and their dependencies for processing documents and generating
-    knowledge graphs.
+    knowledge graphs. Use `ToolBox.agent_graph` to reuse one compiled graph
+    per ToolBox.
 
     Args:
         tools: The ToolBox instance containing all necessary tools for the workflow.
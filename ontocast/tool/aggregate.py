@@ -20,6 +20,9 @@ from ontocast.tool.onto import EntityMetadata, PredicateMetadata
 
 logger = logging.getLogger(__name__)
 
+# Marker of chunk-local namespaces, see `Chunk.iri`
+CHUNK_PATTERN = "/chunk/"
+
 
 class ChunkRDFGraphAggregator:
     """Main class for aggregating and disambiguating chunk graphs.
@@ -118,10 +121,17 @@ class ChunkRDFGraphAggregator:
     def _collect_namespace_info(
         self, chunks: list[Chunk], doc_namespace: str, aggregated_graph: RDFGraph
     ) -> dict[str, Union[dict[str, str], set[str]]]:
-        """Collect and bind all namespaces from chunks."""
+        """Collect and bind all namespaces from chunks.
+
+        Namespace sanitation is done here in the same pass (see `Chunk.sanitize`):
+        prefixes bound to chunk-local namespaces are dropped, since chunk IRIs are
+        remapped to the document namespace, and a URI bound under several prefixes
+        keeps the shortest (then alphabetically first) one.
+        """
         all_namespaces = {}
         chunk_namespaces = set()
         preferred_namespaces = set()
+        uri_to_prefix: dict[str, str] = {}
 
         for chunk in chunks:
             if chunk.graph is None:
@@ -130,19 +140,24 @@ class ChunkRDFGraphAggregator:
             chunk_namespaces.add(chunk.namespace)
 
             for prefix, uri in chunk.graph.namespaces():
-                if prefix not in all_namespaces:
-                    all_namespaces[prefix] = uri
-                elif all_namespaces[prefix] != uri:
-                    # Handle prefix conflicts
-                    new_prefix = f"{prefix}_{len(all_namespaces)}"
-                    all_namespaces[new_prefix] = uri
+                uri_str = str(uri)
+                if CHUNK_PATTERN in uri_str:
+                    continue
+                current = uri_to_prefix.get(uri_str)
+                if current is None or (len(prefix), prefix) < (len(current), current):
+                    uri_to_prefix[uri_str] = prefix
+
+        for uri_str, prefix in uri_to_prefix.items():
+            if prefix in all_namespaces:
+                # Handle prefix conflicts
+                prefix = f"{prefix}_{len(all_namespaces)}"
+            all_namespaces[prefix] = URIRef(uri_str)
 
         # Identify preferred (ontology) namespaces
+        chunk_prefixes = tuple(chunk_namespaces)
         for uri in all_namespaces.values():
             uri_str = str(uri)
-            if uri_str != doc_namespace and not any(
-                uri_str.startswith(ns) for ns in chunk_namespaces
-            ):
+            if uri_str != doc_namespace and not uri_str.startswith(chunk_prefixes):
                 preferred_namespaces.add(uri_str)
 
         # Bind namespaces to aggregated graph
@@ -233,6 +248,7 @@ class ChunkRDFGraphAggregator:
         """Create mapping from original to canonical entity URIs."""
         entity_mapping = {}
         canonical_entities = set()
+        chunk_prefixes = tuple(chunk_namespaces)
 
         # Process similar entity groups
         for group in entity_groups:
@@ -252,7 +268,7 @@ class ChunkRDFGraphAggregator:
             if entity not in entity_mapping:
                 entity_str = str(entity)
                 # Only map chunk-local entities to document namespace
-                if any(entity_str.startswith(ns) for ns in chunk_namespaces):
+                if entity_str.startswith(chunk_prefixes):
                     local_name = self._clean_name(
                         all_entities[entity].local_name or "entity"
                     )
@@ -275,6 +291,7 @@ class ChunkRDFGraphAggregator:
         """Create mapping from original to canonical predicate URIs."""
         predicate_mapping = {}
         canonical_predicates = set()
+        chunk_prefixes = tuple(chunk_namespaces)
 
         # Process similar predicate groups
         for group in predicate_groups:
@@ -293,7 +310,7 @@ class ChunkRDFGraphAggregator:
         for predicate in all_predicates:
             if predicate not in predicate_mapping:
                 predicate_str = str(predicate)
-                if any(predicate_str.startswith(ns) for ns in chunk_namespaces):
+                if predicate_str.startswith(chunk_prefixes):
                     local_name = self._clean_name(
                         all_predicates[predicate].local_name or "predicate"
                     )
@@ -363,7 +380,25 @@ class ChunkRDFGraphAggregator:
         doc_namespace: str,
         chunk_namespaces: set[str],
     ) -> None:
-        """Process triples from all chunks with disambiguation."""
+        """Process triples from all chunks with disambiguation.
+
+        Triples are added straight into ``aggregated_graph``; its store already
+        deduplicates identical triples, so no explicit comparison is done here.
+        """
+        # str.startswith accepts a tuple, which avoids a generator per term
+        chunk_prefixes = tuple(chunk_namespaces)
+        # Terms recur across triples and chunks: resolve each one only once
+        entity_terms: dict = {}
+        predicate_terms: dict = {}
+        add = aggregated_graph.add
+
+        def resolve(term, mapping: dict[URIRef, URIRef], resolved: dict):
+            new_term = resolved.get(term)
+            if new_term is None:
+                new_term = self._apply_mapping(term, mapping, chunk_prefixes)
+                resolved[term] = new_term
+            return new_term
+
         for chunk in chunks:
             if chunk.graph is None:
                 continue
@@ -372,10 +407,8 @@ class ChunkRDFGraphAggregator:
 
             # Add minimal provenance if requested
             if self.include_provenance:
-                aggregated_graph.add((chunk_iri, RDF.type, PROV.Entity))
-                aggregated_graph.add(
-                    (chunk_iri, PROV.wasPartOf, URIRef(doc_namespace.rstrip("#/")))
-                )
+                add((chunk_iri, RDF.type, PROV.Entity))
+                add((chunk_iri, PROV.wasPartOf, URIRef(doc_namespace.rstrip("#/"))))
 
             # Process triples with mapping
             for subj, pred, obj in chunk.graph:
@@ -384,28 +417,16 @@ class ChunkRDFGraphAggregator:
                     continue
 
                 # Apply mappings based on namespace
-                new_subj = (
-                    self._apply_mapping(subj, entity_mapping, chunk_namespaces)
-                    if isinstance(subj, (URIRef, Literal))
-                    else subj
-                )
-                new_pred = (
-                    self._apply_mapping(pred, predicate_mapping, chunk_namespaces)
-                    if isinstance(pred, (URIRef, Literal))
-                    else pred
-                )
+                new_subj = resolve(subj, entity_mapping, entity_terms)
+                new_pred = resolve(pred, predicate_mapping, predicate_terms)
 
                 # Special handling for rdf:type objects (preserve ontology classes)
                 if new_pred == RDF.type and isinstance(obj, URIRef):
                     new_obj = obj  # Keep ontology classes unchanged
                 else:
-                    new_obj = (
-                        self._apply_mapping(obj, entity_mapping, chunk_namespaces)
-                        if isinstance(obj, (URIRef, Literal))
-                        else obj
-                    )
+                    new_obj = resolve(obj, entity_mapping, entity_terms)
 
-                aggregated_graph.add((new_subj, new_pred, new_obj))
+                add((new_subj, new_pred, new_obj))
 
                 # Add selective provenance
                 if (
@@ -413,20 +434,20 @@ class ChunkRDFGraphAggregator:
                     and isinstance(new_subj, URIRef)
                     and str(new_subj).startswith(doc_namespace)
                 ):
-                    aggregated_graph.add((new_subj, PROV.wasGeneratedBy, chunk_iri))
+                    add((new_subj, PROV.wasGeneratedBy, chunk_iri))
 
     def _apply_mapping(
         self,
         uri: Union[URIRef, Literal],
         mapping: dict[URIRef, URIRef],
-        chunk_namespaces: set[str],
+        chunk_prefixes: tuple[str, ...],
     ) -> Union[URIRef, Literal]:
         """Apply mapping only if URI is from chunk namespace."""
         if not isinstance(uri, URIRef):
             return uri
 
-        uri_str = str(uri)
-        if any(uri_str.startswith(ns) for ns in chunk_namespaces):
+        # rdflib's URIRef.startswith stringifies its argument, so use str's
+        if str(uri).startswith(chunk_prefixes):
             return mapping.get(uri, uri)
         return uri
 
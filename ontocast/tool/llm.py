@@ -39,9 +39,10 @@ Cache Usage:
 
 import asyncio
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Type, TypeVar
 
+import openai
 from langchain.output_parsers import PydanticOutputParser
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages.ai import AIMessage
@@ -59,6 +60,23 @@ T = TypeVar("T", bound=BaseModel)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _parser_for(output_schema: Type[BaseModel]) -> tuple[PydanticOutputParser, str]:
+    """Get the output parser for a schema and its format instructions.
+
+    Rendering the format instructions walks the whole JSON schema, so parser
+    and instructions are built once per schema and reused.
+
+    Args:
+        output_schema: The Pydantic model class defining the output structure.
+
+    Returns:
+        tuple[PydanticOutputParser, str]: The parser and its format instructions.
+    """
+    parser = PydanticOutputParser(pydantic_object=output_schema)
+    return parser, parser.get_format_instructions()
+
+
 def track_llm_usage(func: Callable) -> Callable:
     """Decorator to track LLM usage automatically."""
 
@@ -174,7 +192,20 @@ class LLMTool(Tool):
 
         Returns:
             LLMTool: A new instance of the LLM tool.
+
+        Raises:
+            RuntimeError: If called while an event loop is running; use
+                ``acreate`` there instead.
         """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "LLMTool.create() cannot be called from a running event loop; "
+                "use 'await LLMTool.acreate(...)' instead"
+            )
         return asyncio.run(
             cls.acreate(
                 config=config, cache=cache, budget_tracker=budget_tracker, **kwargs
@@ -205,6 +236,20 @@ class LLMTool(Tool):
         await self.setup()
         return self
 
+    def with_budget_tracker(self, budget_tracker: Any) -> "LLMTool":
+        """Get a tool that shares this tool's model client, with its own tracker.
+
+        The copy reuses the underlying chat model, and with it the provider
+        client and its HTTP connection pool, as well as the response cache.
+
+        Args:
+            budget_tracker: The budget tracker instance for the copy.
+
+        Returns:
+            LLMTool: A shallow copy of this tool using ``budget_tracker``.
+        """
+        return self.model_copy(update={"budget_tracker": budget_tracker})
+
     async def setup(self):
         """Set up the language model based on the configured provider.
 
@@ -273,6 +318,7 @@ class LLMTool(Tool):
         logger.debug(f"Cache miss, calling LLM for __call__: {prompt_str[:50]}...")
 
         response = await self.llm.ainvoke(*args, **kwds)
+        self._log_prompt_cache_usage(response)
 
         # Cache the response
         response_data = {
@@ -322,6 +368,7 @@ class LLMTool(Tool):
         logger.debug(f"Cache miss, calling LLM for acall: {prompt_str[:50]}...")
 
         response = await self.llm.ainvoke(*args, **kwds)
+        self._log_prompt_cache_usage(response)
 
         # Cache the response
         response_data = {
@@ -349,6 +396,29 @@ class LLMTool(Tool):
             )
         return self._llm
 
+    def _log_prompt_cache_usage(self, response: Any) -> None:
+        """Log how many input tokens were served from the provider prompt cache.
+
+        Args:
+            response: The message returned by the language model, or a chat
+                completion returned by the OpenAI SDK client.
+        """
+        usage = getattr(response, "usage_metadata", None)
+        if usage:
+            input_details = usage.get("input_token_details") or {}
+            cache_read = input_details.get("cache_read")
+            input_tokens = usage.get("input_tokens")
+        else:
+            usage = getattr(response, "usage", None)
+            prompt_details = getattr(usage, "prompt_tokens_details", None)
+            cache_read = getattr(prompt_details, "cached_tokens", None)
+            input_tokens = getattr(usage, "prompt_tokens", None)
+        if cache_read:
+            logger.debug(
+                f"Prompt cache: {cache_read}/{input_tokens} "
+                "input tokens read from cache"
+            )
+
     def _prompt_to_string(self, prompt) -> str:
         """Convert various prompt types to string for caching.
 
@@ -422,11 +492,19 @@ class LLMTool(Tool):
 
         Returns:
             T: The extracted data conforming to the output schema.
+
+        Note:
+            Both providers constrain the output server-side where possible, so
+            the prompt carries no format instructions: OpenAI through strict
+            structured outputs, Ollama through the ``format`` JSON schema. Other
+            cases fall back to appending the parser's format instructions.
         """
-        parser = PydanticOutputParser(pydantic_object=output_schema)
-        format_instructions = parser.get_format_instructions()
+        if self.config.provider == LLMProvider.OPENAI and not kwargs:
+            result = await self._raw_extract(prompt, output_schema)
+            if result is not None:
+                return result
 
-        full_prompt = f"{prompt}\n\n{format_instructions}"
+        parser, format_instructions = _parser_for(output_schema)
 
         # Prepare configuration for caching
         config_dict = {
@@ -437,6 +515,14 @@ class LLMTool(Tool):
             "output_schema": output_schema.__name__,
         }
 
+        model_kwargs = dict(kwargs)
+        if self.config.provider == LLMProvider.OLLAMA:
+            full_prompt = prompt
+            model_kwargs["format"] = output_schema.model_json_schema()
+            config_dict["response_format"] = "json_schema"
+        else:
+            full_prompt = f"{prompt}\n\n{format_instructions}"
+
         # Check cache first
         cached_response = self.cache.get(full_prompt, config=config_dict, **kwargs)
 
@@ -453,16 +539,111 @@ class LLMTool(Tool):
         # Generate new response
         logger.debug(f"Cache miss, calling LLM for extraction: {prompt[:50]}...")
 
-        response = await self.llm.ainvoke(full_prompt, **kwargs)
+        response = await self.llm.ainvoke(full_prompt, **model_kwargs)
+        content = response.content
+        if not isinstance(content, str):
+            content = str(content)
 
         # Cache the response
         response_data = {
-            "content": response.content,
+            "content": content,
             "prompt": self._prompt_to_string(full_prompt),
             "output_schema": output_schema.__name__,
             "kwargs": kwargs,
         }
         self.cache.set(full_prompt, response_data, config=config_dict, **kwargs)
 
-        content = response.content
-        return parser.parse(content if isinstance(content, str) else str(content))
+        # Parse off the event loop so concurrent extractions keep dispatching
+        return await asyncio.to_thread(parser.parse, content)
+
+    async def _raw_extract(self, prompt: str, output_schema: Type[T]) -> T | None:
+        """Extract with OpenAI structured outputs through the SDK client.
+
+        The request goes straight to the chat model's ``AsyncOpenAI`` client
+        (sharing its connection pool) with the schema as a strict
+        ``json_schema`` response format, so no format instructions are added
+        to the prompt and the provider guarantees schema-valid JSON.
+
+        Args:
+            prompt: The input prompt for extraction.
+            output_schema: The Pydantic model class defining the output structure.
+
+        Returns:
+            T | None: The extracted data, or None if the schema or response
+                cannot be used, in which case the caller falls back to the
+                LangChain path.
+        """
+        config_dict = {
+            "provider": self.config.provider,
+            "model_name": self.config.model_name,
+            "temperature": self.config.temperature,
+            "base_url": self.config.base_url,
+            "output_schema": output_schema.__name__,
+            "response_format": "json_schema",
+        }
+
+        cached_response = self.cache.get(prompt, config=config_dict)
+        if cached_response is not None:
+            logger.debug(f"Cache hit for structured extraction: {prompt[:50]}...")
+            return output_schema.model_validate_json(str(cached_response["content"]))
+
+        logger.debug(f"Cache miss, calling OpenAI for extraction: {prompt[:50]}...")
+        client = getattr(self.llm, "root_async_client", None)
+        if client is None:
+            return None
+        try:
+            completion = await client.chat.completions.parse(
+                model=str(self.config.model_name),
+                messages=[{"role": "user", "content": prompt}],
+                response_format=output_schema,
+                temperature=self.config.temperature,
+            )
+        except (
+            # Also covers OpenAI-compatible servers without json_schema support
+            openai.APIError,
+            openai.LengthFinishReasonError,
+            openai.ContentFilterFinishReasonError,
+        ) as e:
+            logger.warning(
+                f"Structured output failed for {output_schema.__name__}, "
+                f"falling back to format instructions: {e}"
+            )
+            return None
+        self._log_prompt_cache_usage(completion)
+
+        message = completion.choices[0].message
+        if message.parsed is None or message.content is None:
+            return None
+
+        response_data = {
+            "content": message.content,
+            "prompt": prompt,
+            "output_schema": output_schema.__name__,
+        }
+        self.cache.set(prompt, response_data, config=config_dict)
+        return message.parsed
+
+    async def batch_extract(
+        self, prompts: list[str], output_schema: Type[T], **kwargs
+    ) -> list[T]:
+        """Extract structured data from several prompts concurrently.
+
+        Each prompt goes through `extract`, so caching, usage tracking and the
+        provider's structured-output mode are the same as for single calls;
+        at most ``config.max_concurrency`` requests are in flight.
+
+        Args:
+            prompts: The input prompts for extraction.
+            output_schema: The Pydantic model class defining the output structure.
+            **kwargs: Additional keyword arguments for extraction.
+
+        Returns:
+            list[T]: The extracted data, in the order of ``prompts``.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def extract_one(prompt: str) -> T:
+            async with semaphore:
+                return await self.extract(prompt, output_schema, **kwargs)
+
+        return list(await asyncio.gather(*(extract_one(p) for p in prompts)))
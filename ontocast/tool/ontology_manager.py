@@ -6,6 +6,7 @@ lineage using hash-based identifiers.
 """
 
 import logging
+from itertools import chain
 
 from pydantic import Field
 
@@ -42,6 +43,13 @@ class OntologyManager(Tool):
         # Cache dictionary mapping IRI to hash of freshest terminal ontology.
         # Updated incrementally when ontologies are added.
         self._cached_ontologies: dict[str, str] = {}
+        # Cache of the rendered numbered ontology list used for ontology
+        # selection, keyed on the identity/properties of the listed ontologies.
+        self._rendered_list_cache: tuple[tuple, str] | None = None
+        # Lookup index filled by add_ontology: hash -> ontology. Hits are
+        # verified against ontology_versions, misses fall back to a scan, so
+        # direct edits of the versions stay visible.
+        self._hash_index: dict[str, Ontology] = {}
 
     def __contains__(self, item):
         """Check if an item (IRI or ontology_id) is in the ontology manager.
@@ -56,11 +64,45 @@ class OntologyManager(Tool):
         if item in self.ontology_versions:
             return True
         # Check by ontology_id (fallback for backward compatibility)
+        return bool(self._iris_for_ontology_id(item))
+
+    def _iris_for_ontology_id(self, ontology_id: str) -> list[str]:
+        """Get the IRIs that have a version with the given ontology_id.
+
+        Args:
+            ontology_id: The ontology_id to look up.
+
+        Returns:
+            list[str]: Matching IRIs, in insertion order.
+        """
+
+        # ontology_id is assigned after add_ontology (e.g. by set_properties
+        # when properties are inferred), so an index could miss IRIs; scan
+        return [
+            iri
+            for iri, versions in self.ontology_versions.items()
+            if any(o.ontology_id == ontology_id for o in versions)
+        ]
+
+    def _find_by_hash(self, hash: str) -> Ontology | None:
+        """Get the ontology version with the given hash.
+
+        Args:
+            hash: The version hash.
+
+        Returns:
+            Ontology | None: The matching version, or None if not found.
+        """
+        o = self._hash_index.get(hash)
+        if o is not None and o.hash == hash:
+            if any(v is o for v in self.ontology_versions.get(o.iri, ())):
+                return o
         for versions in self.ontology_versions.values():
             for o in versions:
-                if o.ontology_id == item:
-                    return True
-        return False
+                if o.hash == hash:
+                    self._hash_index[hash] = o
+                    return o
+        return None
 
     def add_ontology(self, ontology: Ontology) -> None:
         """Add an ontology to the version tree for its IRI.
@@ -98,6 +140,7 @@ class OntologyManager(Tool):
         existing_hashes = {o.hash for o in self.ontology_versions[ontology.iri]}
         if ontology.hash not in existing_hashes:
             self.ontology_versions[ontology.iri].append(ontology)
+            self._hash_index[ontology.hash] = ontology
             # Update cache for this specific IRI (store hash only)
             freshest = self.get_freshest_terminal_ontology_by_iri(ontology.iri)
             if freshest and freshest.hash:
@@ -156,11 +199,7 @@ class OntologyManager(Tool):
         """
         if ontology_id:
             # Find IRI(s) matching this ontology_id
-            matching_iris = [
-                iri
-                for iri, versions in self.ontology_versions.items()
-                if any(o.ontology_id == ontology_id for o in versions)
-            ]
+            matching_iris = self._iris_for_ontology_id(ontology_id)
             if not matching_iris:
                 return []
             # Get terminals for all matching IRIs
@@ -228,11 +267,7 @@ class OntologyManager(Tool):
         """
         if ontology_id:
             # Find IRI(s) matching this ontology_id
-            matching_iris = [
-                iri
-                for iri, versions in self.ontology_versions.items()
-                if any(o.ontology_id == ontology_id for o in versions)
-            ]
+            matching_iris = self._iris_for_ontology_id(ontology_id)
             if not matching_iris:
                 return None
             # Get freshest for all matching IRIs and return the most recent
@@ -276,9 +311,8 @@ class OntologyManager(Tool):
         """
         # Find all IRIs matching this ontology_id
         all_versions = []
-        for iri, versions in self.ontology_versions.items():
-            if any(o.ontology_id == ontology_id for o in versions):
-                all_versions.extend(versions)
+        for iri in self._iris_for_ontology_id(ontology_id):
+            all_versions.extend(self.ontology_versions[iri])
         return all_versions
 
     def get_lineage_graph_by_iri(self, iri: str):
@@ -305,9 +339,11 @@ class OntologyManager(Tool):
             networkx.DiGraph: The lineage graph for the ontology, or None if not found.
         """
         # Find first IRI matching this ontology_id
-        for iri, versions in self.ontology_versions.items():
-            if any(o.ontology_id == ontology_id for o in versions):
-                return Ontology.build_lineage_graph(versions)
+        matching_iris = self._iris_for_ontology_id(ontology_id)
+        if matching_iris:
+            return Ontology.build_lineage_graph(
+                self.ontology_versions[matching_iris[0]]
+            )
         return None
 
     def get_ontology(
@@ -332,10 +368,9 @@ class OntologyManager(Tool):
         """
         # If hash is provided, search by hash first
         if hash:
-            for versions in self.ontology_versions.values():
-                for o in versions:
-                    if o.hash == hash:
-                        return o
+            found = self._find_by_hash(hash)
+            if found is not None:
+                return found
 
         # Try by IRI first (preferred method)
         if ontology_iri is not None:
@@ -358,11 +393,7 @@ class OntologyManager(Tool):
         # Try by ontology_id if provided (backward compatibility)
         if ontology_id is not None:
             # Find IRI(s) matching this ontology_id
-            matching_iris = [
-                iri
-                for iri, versions in self.ontology_versions.items()
-                if any(o.ontology_id == ontology_id for o in versions)
-            ]
+            matching_iris = self._iris_for_ontology_id(ontology_id)
             if matching_iris:
                 # Use first matching IRI
                 iri = matching_iris[0]
@@ -460,7 +491,36 @@ class OntologyManager(Tool):
 
         return result
 
-    def update_ontology(self, ontology_id: str, ontology_addendum: RDFGraph):
+    @property
+    def ontologies_list_rendered(self) -> str:
+        """Get the numbered list of ontologies presented for ontology selection.
+
+        Each entry is the ontology description, numbered from 1, followed by a
+        final entry for "None of the ontologies matches the text". The rendered
+        string is cached and only rebuilt when the set of ontologies or their
+        described properties change.
+
+        Returns:
+            str: The numbered list of ontologies.
+        """
+        ontologies = self.ontologies
+        key = tuple((o.hash, o.ontology_id, o.description, o.iri) for o in ontologies)
+        if self._rendered_list_cache is not None:
+            cached_key, cached_list = self._rendered_list_cache
+            if cached_key == key:
+                return cached_list
+
+        lines = [
+            f"{i}. {ontology.describe()}" for i, ontology in enumerate(ontologies, 1)
+        ]
+        lines.append(f"{len(ontologies) + 1}. None of the ontologies matches the text")
+        rendered = "\n\n".join(lines)
+        self._rendered_list_cache = (key, rendered)
+        return rendered
+
+    def update_ontology(
+        self, ontology_id: str, ontology_addendum: RDFGraph | list[RDFGraph]
+    ):
         """Update an existing ontology with additional triples.
 
         Note: This method is deprecated. Use add_ontology() with a new version
@@ -468,14 +528,27 @@ class OntologyManager(Tool):
 
         Args:
             ontology_id: The short name of the ontology to update.
-            ontology_addendum: The RDF graph containing additional triples to add.
+            ontology_addendum: The RDF graph, or several graphs, containing
+                additional triples to add.
         """
         logger.warning(
             "update_ontology() is deprecated. Use add_ontology() with version tracking instead."
         )
         terminals = self.get_terminal_ontologies(ontology_id)
         if terminals:
-            terminals[0] += ontology_addendum
+            target = terminals[0].graph
+            addenda = (
+                [ontology_addendum]
+                if isinstance(ontology_addendum, RDFGraph)
+                else ontology_addendum
+            )
+            # Fold all addenda into the target graph in one addN batch
+            target.addN(
+                (s, p, o, target) for s, p, o in chain.from_iterable(addenda)
+            )
+            for addendum in addenda:
+                for prefix, uri in addendum.namespaces():
+                    target.bind(prefix, uri)
             # Update cache for the IRI (though this method is deprecated)
             iri = terminals[0].iri
             freshest = self.get_freshest_terminal_ontology_by_iri(iri)
@@ -107,7 +107,11 @@ class FilesystemTripleStoreManager(TripleStoreManager):
 
         fname: str = kwargs.pop("fname")
         output_path = self.working_directory / fname
-        graph.serialize(format="turtle", destination=output_path)
+        if isinstance(graph, RDFGraph):
+            # Reuse the cached Turtle text if the graph was serialized before
+            output_path.write_text(graph.to_turtle(), encoding="utf-8")
+        else:
+            graph.serialize(format="turtle", destination=output_path)
         logger.info(f"Graph saved to {output_path}")
 
     def serialize(self, o: Ontology | RDFGraph, graph_uri: str | None = None):
@@ -708,7 +708,11 @@ class FusekiTripleStoreManager(TripleStoreManagerWithAuth):
         default_graph_uri = kwargs.get("default_graph_uri")
         log_prefix = kwargs.get("log_prefix")
 
-        turtle_data = graph.serialize(format="turtle")
+        turtle_data = (
+            graph.to_turtle()
+            if isinstance(graph, RDFGraph)
+            else graph.serialize(format="turtle")
+        )
         if graph_uri is None:
             graph_uri = default_graph_uri
 
@@ -1,13 +1,18 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import PromptTemplate
+from langgraph.graph.state import CompiledStateGraph
+from pydantic import BaseModel, create_model
+from rdflib import URIRef
 
 from ontocast.config import Config
 from ontocast.onto.constants import ONTOLOGY_NULL_IRI
 from ontocast.onto.ontology import Ontology, OntologyProperties
 from ontocast.onto.rdfgraph import RDFGraph
 from ontocast.onto.state import AgentState
+from ontocast.onto.util import derive_ontology_id
 from ontocast.tool import (
     ChunkerTool,
     ConverterTool,
@@ -16,7 +21,7 @@ from ontocast.tool import (
     Neo4jTripleStoreManager,
 )
 from ontocast.tool.aggregate import ChunkRDFGraphAggregator
-from ontocast.tool.cache import Cacher
+from ontocast.tool.cache import Cacher, ToolCacher
 from ontocast.tool.graph_diff import DiffTool
 from ontocast.tool.graph_version_manager import GraphVersionManager
 from ontocast.tool.llm import LLMTool
@@ -28,32 +33,87 @@ from ontocast.tool.triple_manager.core import (
 
 logger = logging.getLogger(__name__)
 
+def _in_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
 
-async def update_ontology_properties(o: Ontology, llm_tool: LLMTool):
+
+async def update_ontology_properties(
+    o: Ontology,
+    llm_tool: LLMTool,
+    cache: ToolCacher | None = None,
+    min_triples: int = 0,
+):
     """Update ontology properties using LLM analysis, only if missing.
 
     This function uses the LLM tool to analyze and update the properties
     of a given ontology based on its graph content, but only if any key
-    property is missing or empty.
+    property is missing or empty. Ontologies with fewer than ``min_triples``
+    triples besides their own header give the LLM nothing to summarize;
+    they get defaults derived from their IRI instead.
     """
     # Only update if any key property is missing or empty
     if (o.title is None) or (o.ontology_id is None) or (o.description is None):
-        props = await render_ontology_summary(o, llm_tool)
+        header = sum(1 for _ in o.graph.triples((URIRef(o.iri), None, None)))
+        n_content = len(o.graph) - header
+        if n_content < min_triples:
+            logger.debug(
+                f"Skipping LLM summary for ontology {o.iri}: "
+                f"{n_content} content triple(s)"
+            )
+            o.set_properties(**_default_properties(o).model_dump())
+            return
+        props = await render_ontology_summary(o, llm_tool, cache=cache)
         o.set_properties(**props.model_dump())
 
 
-async def update_ontology_manager(om: OntologyManager, llm_tool: LLMTool):
+def _default_properties(o: Ontology) -> OntologyProperties:
+    """Get placeholder properties for an ontology too small to summarize.
+
+    Args:
+        o: The ontology.
+
+    Returns:
+        OntologyProperties: A title and ontology_id derived from the IRI.
+    """
+    iri = o.iri if o.iri and o.iri != ONTOLOGY_NULL_IRI else None
+    return OntologyProperties(
+        title=iri or "untitled",
+        ontology_id=derive_ontology_id(iri) if iri else None,
+    )
+
+
+async def update_ontology_manager(
+    om: OntologyManager,
+    llm_tool: LLMTool,
+    max_concurrency: int = 4,
+    cache: ToolCacher | None = None,
+    min_triples: int = 0,
+):
     """Update properties for all ontologies in the manager.
 
-    This function iterates through all ontologies in the manager and updates
-    their properties using the LLM tool.
+    Ontologies are independent, so their LLM calls are issued concurrently,
+    with at most ``max_concurrency`` requests in flight.
 
     Args:
         om: The ontology manager containing ontologies to update.
         llm_tool: The LLM tool instance for analysis.
+        max_concurrency: Maximum number of concurrent LLM calls.
+        cache: Optional cache of ontology summaries, see `render_ontology_summary`.
+        min_triples: Ontologies with fewer triples are not sent to the LLM.
     """
-    for o in om.ontologies:
-        await update_ontology_properties(o, llm_tool)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def update(o: Ontology):
+        async with semaphore:
+            await update_ontology_properties(
+                o, llm_tool, cache=cache, min_triples=min_triples
+            )
+
+    await asyncio.gather(*(update(o) for o in om.ontologies))
 
 
 class ToolBox:
@@ -64,9 +124,18 @@ class ToolBox:
 
     Args:
         config: Configuration object containing all necessary settings.
+        llm: Optional pre-built LLM tool. By default a new one is set up,
+            which requires that no event loop is running (see `abuild`).
+        shared_cache: Optional Cacher for all tool caches; pass the one
+            ``llm`` was built with so every cache goes through one instance.
     """
 
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        llm: LLMTool | None = None,
+        shared_cache: Cacher | None = None,
+    ):
         # Store the config for later use
         self.config = config
 
@@ -77,13 +146,27 @@ class ToolBox:
         working_directory = tool_config.path_config.working_directory
         ontology_directory = tool_config.path_config.ontology_directory
 
+        if llm is None and _in_running_loop():
+            raise RuntimeError(
+                "ToolBox() cannot set up its LLM tool inside a running event loop; "
+                "use 'await ToolBox.abuild(config)' instead"
+            )
+
         # Create shared cache instance with config
-        self.shared_cache = Cacher(config=config)
+        self.shared_cache = (
+            shared_cache if shared_cache is not None else Cacher(config=config)
+        )
+        # Cache of ontology selections keyed on the normalized document excerpt
+        self.selection_cache = ToolCacher(self.shared_cache, "ontology_selection")
+        # Cache of LLM-inferred ontology properties keyed on the ontology hash
+        self.summary_cache = ToolCacher(self.shared_cache, "ontology_summary")
 
         # LLM configuration - pass the entire LLM config to the tool
         self.llm_provider = tool_config.llm_config.provider
-        self.llm: LLMTool = LLMTool.create(
-            config=tool_config.llm_config, cache=self.shared_cache
+        self.llm: LLMTool = (
+            llm
+            if llm is not None
+            else LLMTool.create(config=tool_config.llm_config, cache=self.shared_cache)
         )
 
         # Initialize managers based on backend configuration
@@ -134,11 +217,7 @@ class ToolBox:
             )
 
         self.ontology_manager: OntologyManager = OntologyManager()
-        self.converter: ConverterTool = ConverterTool(cache=self.shared_cache)
-        self.chunker: ChunkerTool = ChunkerTool(
-            chunk_config=tool_config.chunk_config, cache=self.shared_cache
-        )
-        self.aggregator: ChunkRDFGraphAggregator = ChunkRDFGraphAggregator()
+        # converter, chunker and aggregator are built on first access
 
         # SPARQL, version management, and diff tools
         self.sparql_tool: SPARQLTool = SPARQLTool(
@@ -147,6 +226,54 @@ class ToolBox:
         self.version_manager: GraphVersionManager = GraphVersionManager()
         self.diff_tool: DiffTool = DiffTool()
 
+    @classmethod
+    async def abuild(cls, config: Config) -> "ToolBox":
+        """Build and initialize a toolbox from within an event loop.
+
+        The LLM tool is set up with ``LLMTool.acreate`` on the running loop
+        instead of a nested ``asyncio.run``; ontologies are then loaded and
+        summarized as in `initialize`.
+
+        Args:
+            config: Configuration object containing all necessary settings.
+
+        Returns:
+            ToolBox: The initialized toolbox.
+        """
+        shared_cache = Cacher(config=config)
+        llm = await LLMTool.acreate(
+            config=config.get_tool_config().llm_config, cache=shared_cache
+        )
+        tools = cls(config, llm=llm, shared_cache=shared_cache)
+        await tools.initialize()
+        return tools
+
+    @cached_property
+    def converter(self) -> ConverterTool:
+        """Document converter, built on first use."""
+        return ConverterTool(cache=self.shared_cache)
+
+    @cached_property
+    def chunker(self) -> ChunkerTool:
+        """Text chunker, built on first use."""
+        return ChunkerTool(
+            chunk_config=self.config.get_tool_config().chunk_config,
+            cache=self.shared_cache,
+        )
+
+    @cached_property
+    def aggregator(self) -> ChunkRDFGraphAggregator:
+        """Aggregator of per-chunk fact graphs, built on first use."""
+        return ChunkRDFGraphAggregator()
+
+    @cached_property
+    def agent_graph(self) -> CompiledStateGraph:
+        """Agent workflow graph over these tools, compiled on first use."""
+        # Deferred, the workflow module imports ToolBox
+        from ontocast.stategraph.create import create_agent_graph
+
+        return create_agent_graph(self)
+
     async def get_llm_tool(self, budget_tracker):
         """Get an LLM tool instance with a specific budget tracker.
 
@@ -156,12 +283,9 @@ class ToolBox:
         Returns:
             LLMTool: LLM tool with the specified budget tracker.
         """
-        # Create a new LLM tool with the budget tracker
-        return await LLMTool.acreate(
-            config=self.config.tool_config.llm_config,
-            cache=self.shared_cache,
-            budget_tracker=budget_tracker,
-        )
+        # Share the toolbox model client (and its connection pool) instead of
+        # setting up a new provider client per call
+        return self.llm.with_budget_tracker(budget_tracker)
 
     async def update_dataset(self, dataset: str) -> None:
         """Update the dataset for the Fuseki triple store manager.
@@ -187,23 +311,38 @@ class ToolBox:
         if state.current_ontology and state.current_ontology.hash:
             self.ontology_manager.add_ontology(state.current_ontology)
 
+        sinks: list[TripleStoreManager] = []
         if self.filesystem_manager is not None:
-            self.filesystem_manager.serialize(state.current_ontology)
-            self.filesystem_manager.serialize(
-                state.aggregated_facts,
-                graph_uri=state.doc_namespace,
-            )
+            sinks.append(self.filesystem_manager)
         if (
             self.triple_store_manager is not None
             and self.triple_store_manager != self.filesystem_manager
         ):
             # Store ontology in main dataset for reasoning
-            self.triple_store_manager.serialize(state.current_ontology)
-            self.triple_store_manager.serialize(
+            sinks.append(self.triple_store_manager)
+        if not sinks:
+            return
+
+        def write_to(manager: TripleStoreManager) -> None:
+            manager.serialize(state.current_ontology)
+            manager.serialize(
                 state.aggregated_facts,
                 graph_uri=state.doc_namespace,
             )
 
+        if len(sinks) == 1:
+            write_to(sinks[0])
+            return
+
+        # Render the Turtle once up front: the sinks reuse the cached text, and
+        # prefixes the writer generates are bound before the worker threads
+        # read the same graphs
+        state.current_ontology.graph.to_turtle()
+        state.aggregated_facts.to_turtle()
+        with ThreadPoolExecutor(max_workers=len(sinks)) as executor:
+            for future in [executor.submit(write_to, m) for m in sinks]:
+                future.result()
+
     async def initialize(self) -> None:
         """Initialize the toolbox with ontologies and their properties.
 
@@ -216,7 +355,13 @@ class ToolBox:
         synchronized_ontologies = await self._synchronize_ontologies()
         for ontology in synchronized_ontologies:
             self.ontology_manager.add_ontology(ontology)
-        await update_ontology_manager(om=self.ontology_manager, llm_tool=self.llm)
+        await update_ontology_manager(
+            om=self.ontology_manager,
+            llm_tool=self.llm,
+            max_concurrency=self.config.tool_config.llm_config.max_concurrency,
+            cache=self.summary_cache,
+            min_triples=self.config.tool_config.llm_config.min_triples_for_summary,
+        )
 
     async def _synchronize_ontologies(self) -> list[Ontology]:
         """Synchronize ontologies between filesystem and triple store.
@@ -228,8 +373,6 @@ class ToolBox:
         Returns:
             list: The final set of ontologies after synchronization
         """
-        import asyncio
-
         filesystem_ontologies = []
         if self.filesystem_manager is not None:
             # Run sync method in thread pool to avoid blocking
@@ -285,29 +428,65 @@ class ToolBox:
         return triple_store_ontologies
 
 
-async def render_ontology_summary(ontology: Ontology, llm_tool) -> OntologyProperties:
+_SUMMARY_PROMPT_HEAD = "Below is a sample of an ontology in Turtle format:\n\n```ttl\n"
+
+# Part of the summary cache key: bump when the summary prompt or the output
+# model changes, so summaries cached by an older version are not reused
+_SUMMARY_CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=32)
+def _get_summary_model(fields: tuple[str, ...]) -> tuple[type[BaseModel], str]:
+    """Get the output model and prompt tail for a subset of ontology properties.
+
+    Everything in the summary prompt after the Turtle sample depends only on
+    the requested fields, so it is rendered once per field set. The output
+    format is left to `LLMTool.extract`.
+
+    Args:
+        fields: Names of the OntologyProperties fields to request.
+
+    Returns:
+        tuple[type[BaseModel], str]: The model with only ``fields`` and the
+            prompt text that follows the ontology sample.
+    """
+    unset_fields = {}
+    for field in fields:
+        # Get the field definition from the base model
+        base_field = OntologyProperties.model_fields[field]
+        unset_fields[field] = (base_field.annotation, base_field)
+    model = create_model("DynamicOntologyProps", **unset_fields)
+    field_list_str = "\n- ".join(fields)
+    prompt_tail = (
+        "\n```\n\n"
+        "Extract ONLY the following properties that are missing:\n"
+        f"- {field_list_str}"
+    )
+    return model, prompt_tail
+
+
+async def render_ontology_summary(
+    ontology: Ontology, llm_tool, cache: ToolCacher | None = None
+) -> OntologyProperties:
     """Generate a summary of ontology properties using LLM analysis.
 
     This function uses the LLM tool to analyze an RDF graph and generate
     a structured summary of its properties. Only unset fields are requested.
 
+    If a cache is given, results are stored under the ontology content hash
+    and the requested fields, so an unchanged ontology is summarized once
+    across restarts, without sampling its graph again. Empty summaries are
+    not cached.
+
     Args:
         ontology: The ontology to analyze (for checking which fields are set).
         llm_tool: The LLM tool instance for analysis.
+        cache: Optional cache for the inferred properties.
 
     Returns:
         OntologyProperties: A structured summary containing only the missing properties.
     """
-    from pydantic import create_model
-
-    # Sample the graph intelligently (first 100 sections)
-    # This provides context without overwhelming the LLM
-    sampled_graph = sample_ontology_graph(ontology.graph, max_triples=100)
-    # Serialize with consistent ordering to ensure determinism
-    ontology_str = sampled_graph.serialize()
-
     # Determine which fields are unset and need LLM inference
-    unset_fields = {}
     fields_to_fetch = []
 
     # Fields we want to potentially fetch from LLM (excluding internal fields like created_at)
@@ -318,54 +497,63 @@ async def render_ontology_summary(ontology: Ontology, llm_tool) -> OntologyPrope
         value = getattr(ontology, field, None)
         if value is None or (field == "iri" and value == ONTOLOGY_NULL_IRI):
             fields_to_fetch.append(field)
-            # Get the field definition from the base model
-            base_field = OntologyProperties.model_fields[field]
-            unset_fields[field] = (base_field.annotation, base_field)
 
-    if not unset_fields:
+    if not fields_to_fetch:
         # All fields are already set, return empty props
         return OntologyProperties()
 
-    # Create a dynamic model with only unset fields
-    DynamicProps = create_model("DynamicOntologyProps", **unset_fields)
+    summary_config = {
+        "provider": llm_tool.config.provider,
+        "model_name": llm_tool.config.model_name,
+        "fields": ",".join(fields_to_fetch),
+        "version": _SUMMARY_CACHE_VERSION,
+    }
+    if cache is not None and ontology.hash:
+        cached_props = cache.get(ontology.hash, config=summary_config)
+        if isinstance(cached_props, dict):
+            logger.debug(f"Summary cache hit for ontology {ontology.hash}")
+            result = OntologyProperties()
+            for field, value in cached_props.items():
+                setattr(result, field, value)
+            return result
 
-    # Define the output parser
-    parser = PydanticOutputParser(pydantic_object=DynamicProps)
-
-    # Create the prompt template with format instructions
-    field_list_str = "\n- ".join(fields_to_fetch)
-    format_instructions = parser.get_format_instructions()
-
-    # Build the template - use format_instructions as a separate variable to avoid brace conflicts
-    template = (
-        "Below is a sample of an ontology in Turtle format:\n\n"
-        "```ttl\n{ontology_str}\n```\n\n"
-        "Extract ONLY the following properties that are missing:\n"
-        f"- {field_list_str}\n\n"
-        "{format_instructions}"
-    )
+    # Sample the graph intelligently (first 100 sections)
+    # This provides context without overwhelming the LLM
+    ontology_str = sample_ontology_turtle(ontology.graph, max_triples=100)
+    if all(
+        not line.strip() or line.startswith("@prefix")
+        for line in ontology_str.splitlines()
+    ):
+        logger.debug(f"Ontology {ontology.iri} has no triples to summarize")
+        return OntologyProperties()
 
-    prompt = PromptTemplate(
-        template=template,
-        input_variables=["ontology_str"],
-        partial_variables={"format_instructions": format_instructions},
-    )
+    # Dynamic model and prompt tail with only unset fields (cached per field set)
+    model, prompt_tail = _get_summary_model(tuple(fields_to_fetch))
+    prompt = _SUMMARY_PROMPT_HEAD + ontology_str + prompt_tail
 
-    response = await llm_tool(prompt.format_prompt(ontology_str=ontology_str))
-    dynamic_props = parser.parse(response.content)
+    # Structured output where the provider supports it, no parse step
+    dynamic_props = await llm_tool.extract(prompt, model)
 
     # Convert dynamic props to OntologyProperties
     result = OntologyProperties()
-    for field in unset_fields.keys():
+    for field in fields_to_fetch:
         value = getattr(dynamic_props, field, None)
         if value is not None:
             setattr(result, field, value)
 
+    if cache is not None and ontology.hash:
+        cached_props = result.model_dump(
+            mode="json", include=set(fields_to_fetch), exclude_none=True
+        )
+        # An empty summary is likely a failed inference, retry it next time
+        if cached_props:
+            cache.set(ontology.hash, cached_props, config=summary_config)
+
     return result
 
 
-def sample_ontology_graph(graph: RDFGraph, max_triples: int = 100) -> RDFGraph:
-    """Sample an ontology graph to provide a representative subset.
+def sample_ontology_turtle(graph: RDFGraph, max_triples: int = 100) -> str:
+    """Sample an ontology graph as Turtle text.
 
     This function serializes the graph to Turtle format and takes the first
     N blank-line separated sections. This is deterministic and simpler than
@@ -376,17 +564,32 @@ def sample_ontology_graph(graph: RDFGraph, max_triples: int = 100) -> RDFGraph:
         max_triples: Maximum number of sections to include in the sample
 
     Returns:
-        RDFGraph: A sampled version of the ontology with representative triples
+        str: Turtle for a representative subset, prefix declarations included
     """
     # Serialize to turtle
-    turtle_str = graph.serialize(format="turtle")
+    turtle_str = graph.to_turtle()
 
     # Split on blank lines (typical turtle format uses \n\n to separate blocks)
     sections = turtle_str.split("\n\n")
 
     # Take first max_triples sections (or fewer if graph is smaller)
     num_sections = min(len(sections), max_triples)
-    sampled_turtle = "\n\n".join(sections[:num_sections])
+    return "\n\n".join(sections[:num_sections])
+
+
+def sample_ontology_graph(graph: RDFGraph, max_triples: int = 100) -> RDFGraph:
+    """Sample an ontology graph to provide a representative subset.
+
+    See `sample_ontology_turtle` for how the sample is taken.
+
+    Args:
+        graph: The full ontology graph
+        max_triples: Maximum number of sections to include in the sample
+
+    Returns:
+        RDFGraph: A sampled version of the ontology with representative triples
+    """
+    sampled_turtle = sample_ontology_turtle(graph, max_triples=max_triples)
 
     # Parse back into a graph
     sampled = RDFGraph()
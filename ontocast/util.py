@@ -31,6 +31,9 @@ def render_text_hash(text: str, digits=12) -> str:
     """
     Generate a hash for the given text.
 
+    The hash is used as a persistent document/chunk identity (it ends up in
+    IRIs stored in triple stores), so the algorithm must stay stable.
+
     Args:
         text: The text to hash
         digits: Number of digits in the hash (default: 12)
@@ -38,4 +41,4 @@ def render_text_hash(text: str, digits=12) -> str:
     Returns:
         A string hash of the text
     """
-    return hashlib.sha256(text.encode()).hexdigest()[:digits]
+    return hashlib.sha256(text.encode(), usedforsecurity=False).hexdigest()[:digits]
@@ -1,7 +1,8 @@
 import asyncio
 
-from ontocast.onto.ontology import OntologyProperties
-from ontocast.toolbox import render_ontology_summary
+from ontocast.onto.ontology import Ontology, OntologyProperties
+from ontocast.onto.rdfgraph import RDFGraph
+from ontocast.toolbox import render_ontology_summary, update_ontology_properties
 
 
 def test_extract_metadata(test_ontology, llm_tool):
@@ -22,3 +23,19 @@ def test_extract_metadata(test_ontology, llm_tool):
     )
     # Description should contain "test"
     assert "test" in summary.description.lower(), "Description should contain 'test'"
+
+
+def test_update_properties_skips_llm_for_header_only_ontology():
+    graph = RDFGraph()
+    graph.parse(
+        data="@prefix owl: <http://www.w3.org/2002/07/owl#> .\n"
+        "<https://example.com/fish> a owl:Ontology .",
+        format="turtle",
+    )
+    ontology = Ontology(graph=graph)
+
+    # No LLM tool: the ontology must be handled without calling it
+    asyncio.run(update_ontology_properties(ontology, None, min_triples=1))
+
+    assert ontology.title == "https://example.com/fish"
+    assert ontology.ontology_id == "fish"
@@ -1,9 +1,11 @@
 import asyncio
+import json
 
 import pytest
 from rdflib import Literal, URIRef
 
 from ontocast.agent import check_chunks_empty, chunk_text, select_ontology
+from ontocast.onto.chunk import Chunk
 from ontocast.onto.ontology import Ontology
 from ontocast.onto.sparql_models import GraphUpdate, TripleOp
 from ontocast.onto.state import AgentState
@@ -30,6 +32,61 @@ def test_agent_state_json():
     assert custom_triple in loaded_state.current_ontology.graph
 
 
+def test_agent_state_serialize_light(tmp_path):
+    state = AgentState(files={"doc.json": b"{}"}, input_text="text", max_visits=5)
+    path = tmp_path / "state.json"
+    state.serialize_light(path)
+
+    loaded_state = AgentState.load(path)
+
+    assert loaded_state.files == {}
+    assert loaded_state.input_text == ""
+    assert loaded_state.max_visits == 5
+
+
+def test_agent_state_serialize_binary(tmp_path):
+    state = AgentState(files={"doc.pdf": b"%PDF\xff\xfe"})
+    state.current_ontology = Ontology(ontology_id="ex")
+    state.current_ontology.graph.bind("ex", "http://example.com/ex#")
+    custom_triple = (
+        URIRef("http://example.com/ex#subject"),
+        URIRef("http://example.com/ex#predicate"),
+        Literal("object"),
+    )
+    state.current_ontology.graph.add(custom_triple)
+    addendum_triple = (
+        URIRef("http://example.com/ex#subject"),
+        URIRef("http://example.com/ex#addendum"),
+        Literal("extra"),
+    )
+    state.ontology_addendum.graph.bind("ex", "http://example.com/ex#")
+    state.ontology_addendum.graph.add(addendum_triple)
+    chunk = Chunk(text="chunk text", hid="abc", doc_iri="http://example.com/doc")
+    chunk.graph.add(custom_triple)
+    state.chunks_processed.append(chunk)
+
+    state.serialize_binary(tmp_path)
+    loaded_state = AgentState.load_binary(tmp_path)
+
+    assert loaded_state.files == state.files
+    assert custom_triple in loaded_state.current_ontology.graph
+    assert len(loaded_state.current_ontology.graph) == len(
+        state.current_ontology.graph
+    )
+    assert ("ex", URIRef("http://example.com/ex#")) in set(
+        loaded_state.current_ontology.graph.namespaces()
+    )
+    assert addendum_triple in loaded_state.ontology_addendum.graph
+    assert ("ex", URIRef("http://example.com/ex#")) in set(
+        loaded_state.ontology_addendum.graph.namespaces()
+    )
+    saved = json.loads((tmp_path / "state.json").read_text())
+    assert "graph" not in saved["ontology_addendum"]
+    assert len(loaded_state.chunks_processed) == 1
+    assert loaded_state.chunks_processed[0].hid == "abc"
+    assert custom_triple in loaded_state.chunks_processed[0].graph
+
+
 def test_chunks(apple_report: dict, tools, state_chunked_filename):
     state = AgentState()
     state.set_text(apple_report["text"])
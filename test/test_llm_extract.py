@@ -0,0 +1,200 @@
+"""Tests for LLMTool.extract with provider-side structured outputs.
+
+These tests stub the chat models and the OpenAI SDK client, so no provider is
+contacted: they cover the cache, refusal and error paths of the OpenAI
+structured-output request and the ``format`` schema passed to Ollama.
+"""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import openai
+import pytest
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+from langchain_ollama import ChatOllama
+from pydantic import BaseModel
+
+from ontocast.config import LLMConfig, LLMProvider
+from ontocast.tool.cache import Cacher
+from ontocast.tool.llm import LLMTool, _parser_for
+
+
+class Item(BaseModel):
+    """Schema used for the extraction tests."""
+
+    name: str
+
+
+class FakeOpenAIChat(FakeListChatModel):
+    """Fake chat model exposing an OpenAI SDK client like ChatOpenAI."""
+
+    root_async_client: Any = None
+
+
+class StubCompletions:
+    """Stub of ``client.chat.completions`` returning canned completions."""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.calls = []
+
+    async def parse(self, **kwargs):
+        self.calls.append(kwargs)
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+def make_completion(parsed, content, cached_tokens=0):
+    """Build the parts of a parsed chat completion that extract reads."""
+    message = SimpleNamespace(parsed=parsed, content=content, refusal=None)
+    usage = SimpleNamespace(
+        prompt_tokens=10,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+    )
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+def make_tool(tmp_path, outcome, responses=()):
+    """Create an OpenAI LLMTool whose model and client are stubbed."""
+    completions = StubCompletions(outcome)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    tool = LLMTool(
+        config=LLMConfig(provider=LLMProvider.OPENAI, model_name="gpt-4o-mini"),
+        cache=Cacher(cache_dir=tmp_path),
+    )
+    tool._llm = FakeOpenAIChat(responses=list(responses), root_async_client=client)
+    return tool, completions
+
+
+def test_extract_structured_output_cache_hit(tmp_path, caplog):
+    """Test that a structured result is cached and served without the client."""
+    completion = make_completion(Item(name="apple"), '{"name": "apple"}', 4)
+    tool, completions = make_tool(tmp_path, completion)
+
+    with caplog.at_level(logging.DEBUG, logger="ontocast.tool.llm"):
+        first = asyncio.run(tool.extract("name a fruit", Item))
+    second = asyncio.run(tool.extract("name a fruit", Item))
+
+    assert first == second == Item(name="apple")
+    assert len(completions.calls) == 1
+    assert completions.calls[0]["response_format"] is Item
+    assert completions.calls[0]["messages"][0]["content"] == "name a fruit"
+    assert "Prompt cache: 4/10" in caplog.text
+
+
+def test_extract_refusal_falls_back(tmp_path):
+    """Test that a refusal (no parsed output) falls back to format instructions."""
+    tool, completions = make_tool(
+        tmp_path, make_completion(None, None), responses=['{"name": "pear"}']
+    )
+
+    result = asyncio.run(tool.extract("name a fruit", Item))
+
+    assert result == Item(name="pear")
+    assert len(completions.calls) == 1
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        openai.APIError(
+            "json_schema not supported",
+            httpx.Request("POST", "http://localhost/v1/chat/completions"),
+            body=None,
+        ),
+        openai.APIConnectionError(
+            request=httpx.Request("POST", "http://localhost/v1/chat/completions")
+        ),
+    ],
+)
+def test_extract_api_error_falls_back(tmp_path, error):
+    """Test that an API error falls back to the LangChain extraction path."""
+    tool, completions = make_tool(tmp_path, error, responses=['{"name": "plum"}'])
+
+    result = asyncio.run(tool.extract("name a fruit", Item))
+
+    assert result == Item(name="plum")
+    assert len(completions.calls) == 1
+
+
+def test_extract_ollama_passes_format_schema(tmp_path, monkeypatch):
+    """Test that Ollama gets the JSON schema as ``format`` instead of instructions."""
+    calls = []
+
+    async def fake_ainvoke(self, prompt, **kwargs):
+        calls.append((prompt, kwargs))
+        return AIMessage(content='{"name": "fig"}')
+
+    monkeypatch.setattr(ChatOllama, "ainvoke", fake_ainvoke)
+    cacher = Cacher(cache_dir=tmp_path)
+    tool = LLMTool(
+        config=LLMConfig(provider=LLMProvider.OLLAMA, model_name="llama3.1"),
+        cache=cacher,
+    )
+    tool._llm = ChatOllama(model="llama3.1")
+
+    # An entry left by the format-instructions path must not be served
+    _, format_instructions = _parser_for(Item)
+    legacy_prompt = f"name a fruit\n\n{format_instructions}"
+    legacy_config = {
+        "provider": tool.config.provider,
+        "model_name": tool.config.model_name,
+        "temperature": tool.config.temperature,
+        "base_url": tool.config.base_url,
+        "output_schema": Item.__name__,
+    }
+    tool.cache.set(legacy_prompt, {"content": '{"name": "stale"}'}, legacy_config)
+
+    stored = []
+    set_entry = tool.cache.set
+
+    def record_set(content, result, config=None, **kw):
+        stored.append((content, config))
+        set_entry(content, result, config, **kw)
+
+    monkeypatch.setattr(tool.cache, "set", record_set)
+
+    result = asyncio.run(tool.extract("name a fruit", Item))
+
+    assert result == Item(name="fig")
+    assert len(calls) == 1
+    prompt, kwargs = calls[0]
+    assert prompt == "name a fruit"
+    assert format_instructions not in prompt
+    assert kwargs["format"] == Item.model_json_schema()
+    [(content, config)] = stored
+    assert cacher._generate_cache_key(content, config) != cacher._generate_cache_key(
+        legacy_prompt, legacy_config
+    )
+
+
+def test_batch_extract_order_and_bound(tmp_path, monkeypatch):
+    """Test that batch_extract keeps prompt order and bounds concurrency."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_extract(self, prompt, output_schema, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later prompts finish first, so gather order is what keeps the order
+        await asyncio.sleep(0.01 * (10 - int(prompt)))
+        in_flight -= 1
+        return output_schema(name=prompt)
+
+    monkeypatch.setattr(LLMTool, "extract", fake_extract)
+    tool = LLMTool(
+        config=LLMConfig(provider=LLMProvider.OPENAI, max_concurrency=2),
+        cache=Cacher(cache_dir=tmp_path),
+    )
+    prompts = [str(i) for i in range(6)]
+
+    results = asyncio.run(tool.batch_extract(prompts, Item))
+
+    assert [item.name for item in results] == prompts
+    assert peak == 2
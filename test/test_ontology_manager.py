@@ -419,6 +419,31 @@ class TestHasOntologies:
         assert ontology_manager.has_ontologies
 
 
+class TestOntologiesListRendered:
+    """Test the rendered numbered list of ontologies used for selection."""
+
+    def test_list_includes_none_option(self, ontology_manager, sample_ontology):
+        """Test that the list numbers ontologies and ends with the None option."""
+        ontology_manager.add_ontology(sample_ontology)
+        rendered = ontology_manager.ontologies_list_rendered
+
+        assert rendered.startswith(f"1. {sample_ontology.describe()}")
+        assert rendered.endswith("2. None of the ontologies matches the text")
+
+    def test_list_is_rebuilt_when_properties_change(
+        self, ontology_manager, sample_ontology
+    ):
+        """Test that the cached list is invalidated when a description changes."""
+        ontology_manager.add_ontology(sample_ontology)
+        first = ontology_manager.ontologies_list_rendered
+        assert ontology_manager.ontologies_list_rendered is first
+
+        sample_ontology.description = "A new description"
+        rendered = ontology_manager.ontologies_list_rendered
+        assert rendered != first
+        assert "A new description" in rendered
+
+
 class TestLineageGraph:
     """Test lineage graph building."""
 
@@ -532,6 +557,46 @@ class TestContains:
         assert sample_ontology.iri in ontology_manager
         assert "https://example.org/nonexistent" not in ontology_manager
 
+    def test_contains_follows_renamed_ontology_id(
+        self, ontology_manager, sample_ontology
+    ):
+        """Test that the ontology_id index does not go stale on renames."""
+        ontology_manager.add_ontology(sample_ontology)
+        assert "test" in ontology_manager
+
+        sample_ontology.ontology_id = "renamed"
+
+        assert "test" not in ontology_manager
+        assert "renamed" in ontology_manager
+        assert ontology_manager.get_ontology(ontology_id="renamed") is sample_ontology
+
+    def test_ontology_id_shared_by_two_iris(self, ontology_manager, sample_ontology):
+        """Test that an ontology_id assigned after adding is found for every IRI."""
+        graph = RDFGraph()
+        graph.parse(
+            data="<https://example.org/other> a "
+            "<http://www.w3.org/2002/07/owl#Ontology> .",
+            format="turtle",
+        )
+        other = Ontology(
+            graph=graph,
+            ontology_id="other",
+            iri="https://example.org/other",
+            title="Other Ontology",
+            version="1.0.0",
+        )
+        ontology_manager.add_ontology(sample_ontology)
+        ontology_manager.add_ontology(other)
+
+        other.ontology_id = "test"
+
+        assert ontology_manager._iris_for_ontology_id("test") == [
+            sample_ontology.iri,
+            other.iri,
+        ]
+        versions = ontology_manager.get_ontology_versions("test")
+        assert {o.iri for o in versions} == {sample_ontology.iri, other.iri}
+
 
 class TestRecreateFromRDFGraph:
     """Test recreating Ontology from RDF graph with parent_hashes and created_at."""
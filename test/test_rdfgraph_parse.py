@@ -0,0 +1,47 @@
+"""Test for RDFGraph.parse_file fallback from the native parser.
+
+This test verifies that a native parser failing partway through leaves no
+partial triples behind and that rdflib's parser then reads the whole input.
+"""
+
+import io
+
+from rdflib import BNode, Namespace, plugin
+from rdflib.parser import Parser
+
+from ontocast.onto import rdfgraph
+from ontocast.onto.rdfgraph import RDFGraph
+
+EX = Namespace("http://example.org/ns/")
+
+TURTLE = """
+@prefix ex: <http://example.org/ns/> .
+
+ex:subject ex:predicate [ ex:value "blank" ] .
+"""
+
+
+class FailingParser(Parser):
+    """Parser that reads the input, adds a triple and then fails."""
+
+    def parse(self, source, sink, **kwargs):
+        source.getByteStream().read()
+        sink.add((BNode(), EX.partial, EX.triple))
+        raise ValueError("native parser failure")
+
+
+plugin.register("ontocast-failing", Parser, __name__, "FailingParser")
+
+
+def test_parse_file_falls_back_without_partial_triples(monkeypatch):
+    """Test that a failed native parse is discarded and the stream rewound."""
+    monkeypatch.setattr(rdfgraph, "FAST_PARSER_AVAILABLE", True)
+    monkeypatch.setattr(
+        rdfgraph, "FAST_PARSER_FORMATS", {"turtle": "ontocast-failing"}
+    )
+
+    graph = RDFGraph().parse_file(io.BytesIO(TURTLE.encode()), format="turtle")
+
+    assert (None, EX.partial, None) not in graph
+    assert len(graph) == 2
+    assert len(set(graph.subjects(EX.value, None))) == 1
@@ -0,0 +1,45 @@
+"""Test for RDFGraph.to_turtle caching.
+
+This test verifies that the cached Turtle text is reused while the graph is
+unchanged and refreshed after triples or bindings change.
+"""
+
+from rdflib import Literal, Namespace
+
+from ontocast.onto.rdfgraph import RDFGraph
+
+EX = Namespace("http://example.org/ns/")
+
+
+def test_to_turtle_reuses_cached_text():
+    """Test that an unchanged graph is not serialized again."""
+    graph = RDFGraph()
+    graph.bind("ex", EX)
+    graph.add((EX.subject, EX.predicate, Literal("value")))
+
+    first = graph.to_turtle()
+
+    assert graph.to_turtle() is first
+    assert first == graph.serialize(format="turtle")
+
+
+def test_to_turtle_follows_mutations():
+    """Test that adds, removes, SPARQL updates and new bindings are picked up."""
+    graph = RDFGraph()
+    graph.add((EX.subject, EX.predicate, Literal("value")))
+    graph.to_turtle()
+
+    graph.add((EX.subject, EX.predicate, Literal("added")))
+    assert "added" in graph.to_turtle()
+
+    graph.remove((EX.subject, EX.predicate, Literal("added")))
+    assert "added" not in graph.to_turtle()
+
+    graph.update(
+        f'DELETE DATA {{ <{EX.subject}> <{EX.predicate}> "value" }} ; '
+        f'INSERT DATA {{ <{EX.subject}> <{EX.predicate}> "updated" }}'
+    )
+    assert "updated" in graph.to_turtle()
+
+    graph.namespace_manager.bind("other", "http://example.org/other/")
+    assert graph.to_turtle() == graph.serialize(format="turtle")
@@ -0,0 +1,39 @@
+"""Test for select_ontology_batch.
+
+The per-document selector is stubbed, so this checks only the batching: the
+results keep the input order and at most ``max_concurrency`` selections run
+at once.
+"""
+
+import asyncio
+import importlib
+
+from ontocast.agent import select_ontology_batch
+from ontocast.onto.state import AgentState
+
+select_module = importlib.import_module("ontocast.agent.select_ontology")
+
+
+def test_select_ontology_batch_order_and_bound(monkeypatch):
+    """Test that results keep input order and concurrency stays bounded."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_select(state, tools):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later states finish first, so gather order is what keeps the order
+        await asyncio.sleep(0.01 * (10 - state.max_visits))
+        in_flight -= 1
+        state.input_text = f"selected {state.max_visits}"
+        return state
+
+    monkeypatch.setattr(select_module, "select_ontology", fake_select)
+    states = [AgentState(max_visits=i) for i in range(6)]
+
+    results = asyncio.run(select_ontology_batch(states, tools=None, max_concurrency=2))
+
+    assert all(r is s for r, s in zip(results, states))
+    assert [s.input_text for s in results] == [f"selected {i}" for i in range(6)]
+    assert peak == 2